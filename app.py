@@ -1,14 +1,13 @@
 # Standard library imports
 import logging
-from datetime import datetime
+from collections import Counter
 import os
 import random
 
 # Third-party imports
 import numpy as np
 import pandas as pd
-import psycopg2
-from psycopg2.extras import DictCursor
+import psycopg
 from flask import current_app
 
 # current_app added for accessing app context data
@@ -17,10 +16,12 @@ from flask import current_app
 # Assuming this is in src/
 
 # Imports from project package
-from project.db_utils import (
-    get_db_conn,
-    DATABASE_URL,
-)  # DATABASE_URL is for checks here
+from project.db_utils import get_db_conn
+from project.services.prayer_service import (
+    bulk_insert_candidates,
+    nan_to_none,
+    read_representatives_csv,
+)
 from project.app_config import (
     APP_ROOT,
     APP_DATA_DIR,
@@ -67,10 +68,8 @@ def init_db():
     """Initializes the PostgreSQL database and creates tables if they don't exist."""
     # Uses get_db_conn from project.db_utils
     logging.info("app.py: Initializing PostgreSQL database schema...")
-    conn = None
     try:
-        conn = get_db_conn()  # From project.db_utils
-        with conn.cursor() as cursor:
+        with get_db_conn() as conn, conn.cursor() as cursor:
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS prayer_candidates (
@@ -98,32 +97,64 @@ def init_db():
                 "app.py: Ensured idx_candidates_unique index exists on "
                 "prayer_candidates table."
             )
+            # Partial indexes matching the hot reads in prayer_service: the
+            # queue head (status = 'queued' ORDER BY id) and prayed lists and
+            # stats per country (ORDER BY status_timestamp). The INCLUDE
+            # columns let PostgreSQL answer those from the index alone.
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_pc_queued_id
+                ON prayer_candidates (id) WHERE status = 'queued';
+            """
+            )
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_pc_prayed_country_ts
+                ON prayer_candidates (country_code, status_timestamp DESC)
+                INCLUDE (person_name, post_label, party, thumbnail, hex_id)
+                WHERE status = 'prayed';
+            """
+            )
+            # All-country prayed reads (overall list, timedata) order by
+            # status_timestamp without a country prefix to range over.
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_pc_prayed_ts
+                ON prayer_candidates (status_timestamp DESC)
+                WHERE status = 'prayed';
+            """
+            )
+            # Hexes in use per country, for the anti-join that picks a free
+            # hex (prayer_service.get_available_hex_id_for_country) and the
+            # used-hex read in update_queue.
+            cursor.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_pc_hex_in_use
+                ON prayer_candidates (country_code, hex_id)
+                WHERE status IN ('prayed', 'queued') AND hex_id IS NOT NULL;
+            """
+            )
+            logging.info(
+                "app.py: Ensured idx_pc_queued_id, idx_pc_prayed_country_ts, "
+                "idx_pc_prayed_ts and idx_pc_hex_in_use indexes exist on "
+                "prayer_candidates table."
+            )
             conn.commit()
             logging.info(
                 "app.py: Successfully initialized PostgreSQL database tables "
                 "and indexes."
             )
-    except psycopg2.Error as e:
+    except psycopg.Error as e:
         logging.error(f"app.py: Error initializing PostgreSQL database: {e}")
-        if conn:
-            conn.rollback()
     except ValueError as ve:  # Catch DATABASE_URL not configured from get_db_conn
         logging.error(f"app.py: DB Init Error - {str(ve)}")
-    finally:
-        if conn:
-            conn.close()
 
 
 def get_current_queue_items_from_db():
     """Fetches all items from the prayer_candidates table with status 'queued', for PostgreSQL."""
     items = []
-    conn = None
-    if not DATABASE_URL:  # Check imported DATABASE_URL from project.db_utils
-        logging.error("app.py: DATABASE_URL not set, cannot fetch queue items.")
-        return items
     try:
-        conn = get_db_conn()  # From project.db_utils
-        with conn.cursor(cursor_factory=DictCursor) as cursor:
+        with get_db_conn() as conn, conn.cursor() as cursor:
             cursor.execute(
                 """
                 SELECT id, person_name, post_label, country_code, party, thumbnail,
@@ -133,13 +164,13 @@ def get_current_queue_items_from_db():
                 ORDER BY id ASC
             """
             )
-            rows = cursor.fetchall()
-            items = [dict(row) for row in rows]
+            # Rows already come back as dicts (dict_row on the pool).
+            items = cursor.fetchall()
             logging.info(
                 f"app.py: Fetched {len(items)} 'queued' items from "
                 f"prayer_candidates (PostgreSQL)."
             )
-    except psycopg2.Error as e:
+    except psycopg.Error as e:
         logging.error(
             f"app.py: PostgreSQL error in " f"get_current_queue_items_from_db: {e}"
         )
@@ -148,22 +179,20 @@ def get_current_queue_items_from_db():
             f"app.py: Unexpected error in " f"get_current_queue_items_from_db: {e_gen}",
             exc_info=True,
         )
-    finally:
-        if conn:
-            conn.close()
     return items
 
 
 def fetch_csv(country_code):
     """Fetches CSV data for a given country using COUNTRIES_CONFIG from project.app_config."""
     # COUNTRIES_CONFIG is imported from project.app_config
-    logging.debug(f"app.py: Fetching CSV data for {country_code}")
+    logging.debug("app.py: Fetching CSV data for %s", country_code)
     csv_path = COUNTRIES_CONFIG[country_code]["csv_path"]
     try:
-        df = pd.read_csv(csv_path)
-        logging.debug(f"app.py: Successfully fetched {len(df)} rows from {csv_path}")
-        df = df.replace({np.nan: None})
-        logging.debug(f"app.py: Fetched data for {country_code}: {df.head()}")
+        df = read_representatives_csv(csv_path)
+        logging.debug("app.py: Successfully fetched %d rows from %s", len(df), csv_path)
+        # Missing cells stay NaN here; nan_to_none converts only the rows
+        # that are handed on as dicts.
+        logging.debug("app.py: Fetched data for %s: %s", country_code, df.head())
         return df
     except FileNotFoundError:
         logging.error(f"app.py: CSV file not found for {country_code} at {csv_path}")
@@ -174,21 +203,26 @@ def process_deputies(csv_data, country_code):
     """Processes deputies from CSV, populates global deputies_data in this module."""
     # deputies_data is a global in this module.
     # COUNTRIES_CONFIG is used via import.
-    country_deputies_with_images = []
-    country_deputies_without_images = []
-    for _index, row in csv_data.iterrows():  # _index unused
-        image_url = row.get("image_url")
-        processed_row = row.to_dict()
-        if not image_url:
-            country_deputies_without_images.append(processed_row)
-            continue
+    # Split on a boolean mask instead of walking rows; a missing or empty
+    # image_url means "without image".
+    if "image_url" in csv_data.columns:
+        image_urls = csv_data["image_url"]
+        has_image = image_urls.notna() & (image_urls != "")
+    else:
+        has_image = pd.Series(False, index=csv_data.index)
+    with_images_df = csv_data[has_image]
+    if not with_images_df.empty:
         # Retaining 'Image' key as per original logic
-        processed_row["Image"] = image_url
-        country_deputies_with_images.append(processed_row)
-        logging.debug(
-            f"app.py: Image URL assigned for {row.get('person_name')} "
-            f"({country_code}): {image_url}"
-        )
+        with_images_df = with_images_df.assign(Image=with_images_df["image_url"])
+    country_deputies_with_images = nan_to_none(with_images_df).to_dict("records")
+    country_deputies_without_images = nan_to_none(csv_data[~has_image]).to_dict(
+        "records"
+    )
+    logging.debug(
+        "app.py: %d deputies with image URLs in %s.",
+        len(country_deputies_with_images),
+        country_code,
+    )
 
     # Access deputies_data via current_app
     app_deputies_data = current_app.deputies_data
@@ -220,21 +254,13 @@ def update_queue():
     but current HEX_MAP_DATA_STORE is a module global populated by data_initializer.
     """
     logging.info("app.py: Update_queue function execution started.")
-    conn = None
-    if not DATABASE_URL:  # Check imported DATABASE_URL
-        logging.error(
-            "app.py: [update_queue] DATABASE_URL not set. Aborting queue update."
-        )
-        return
-
     # Access HEX_MAP_DATA_STORE via current_app
     # This is populated by data_initializer.py onto the app instance.
     current_hex_map_store = current_app.hex_map_data_store
 
     try:
         logging.info("app.py: [update_queue] Attempting to connect to PostgreSQL DB.")
-        conn = get_db_conn()  # From project.db_utils
-        with conn.cursor(cursor_factory=DictCursor) as cursor:
+        with get_db_conn() as conn, conn.cursor() as cursor:
             logging.info(
                 "app.py: [update_queue] Deleting existing 'queued' items from "
                 "prayer_candidates table."
@@ -282,14 +308,18 @@ def update_queue():
                         else len(df_raw)
                     )
                 ).reset_index(drop=True)
+                df_sampled = nan_to_none(df_sampled)
                 logging.info(
                     f"app.py: Selected {len(df_sampled)} individuals from "
                     f"{country_code_collect} CSV (before filtering prayed)."
                 )
 
-                for _index, row in df_sampled.iterrows():  # _index for unused variable
-                    if row.get("person_name"):
-                        item = row.to_dict()
+                # Plain tuples zipped with the column names; iterrows would
+                # build a Series per row.
+                sampled_columns = df_sampled.columns.tolist()
+                for row_values in df_sampled.itertuples(index=False, name=None):
+                    item = dict(zip(sampled_columns, row_values))
+                    if item.get("person_name"):
                         item["country_code"] = country_code_collect
                         item["party"] = item.get("party") or "Other"
 
@@ -355,8 +385,13 @@ def update_queue():
             )
             random.shuffle(all_potential_candidates)
 
-            items_added_to_db_this_cycle = 0
             available_hex_ids_by_country = {}
+            # Only as many hexes as there are candidates are drawn per country,
+            # in one vectorised sample without replacement.
+            hex_demand_by_country = Counter(
+                item["country_code"] for item in all_potential_candidates
+            )
+            hex_rng = np.random.default_rng()
             random_allocation_countries = [
                 "israel",
                 "iran",
@@ -373,18 +408,27 @@ def update_queue():
                     and not hex_map_gdf_prep.empty
                     and "id" in hex_map_gdf_prep.columns
                 ):
-                    all_map_hex_ids = set(hex_map_gdf_prep["id"].unique())
+                    all_map_hex_ids = current_app.hex_id_sets[country_code_hex_prep]
                     cursor.execute(
                         "SELECT hex_id FROM prayer_candidates WHERE "
                         "country_code = %s AND hex_id IS NOT NULL AND "
-                        "(status = 'prayed' OR status = 'queued')",
+                        "status IN ('prayed', 'queued')",
                         (country_code_hex_prep,),
                     )
                     used_hex_ids = {r["hex_id"] for r in cursor.fetchall()}
-                    current_available_hex_ids = list(all_map_hex_ids - used_hex_ids)
-                    random.shuffle(current_available_hex_ids)
-                    available_hex_ids_by_country[country_code_hex_prep] = (
-                        current_available_hex_ids
+                    current_available_hex_ids = np.array(
+                        list(all_map_hex_ids - used_hex_ids), dtype=object
+                    )
+                    num_hexes_needed = min(
+                        hex_demand_by_country[country_code_hex_prep],
+                        len(current_available_hex_ids),
+                    )
+                    available_hex_ids_by_country[country_code_hex_prep] = list(
+                        hex_rng.choice(
+                            current_available_hex_ids,
+                            size=num_hexes_needed,
+                            replace=False,
+                        )
                     )
                     # logging.info(
                     #    f"app.py: [update_queue] For {country_code_hex_prep}: "
@@ -409,54 +453,20 @@ def update_queue():
                         item_country_code
                     ].pop()
 
-            for item_to_add in all_potential_candidates:
-                # ... (extraction of item_to_add fields) ...
-                person_name = item_to_add["person_name"]
-                post_label = item_to_add.get("post_label")
-                country_code_add = item_to_add["country_code"]
-                party_add = item_to_add["party"]
-                thumbnail_add = item_to_add["thumbnail"]
-                hex_id_to_insert = item_to_add.get("hex_id")
-                current_ts_for_status = (
-                    datetime.now()
-                )  # Use datetime object for psycopg2
-
-                try:
-                    cursor.execute(
-                        """
-                        INSERT INTO prayer_candidates
-                            (person_name, post_label, country_code, party,
-                             thumbnail, status, status_timestamp, hex_id)
-                        VALUES (%s, %s, %s, %s, %s, 'queued', %s, %s)
-                        ON CONFLICT (person_name, post_label, country_code)
-                        DO NOTHING
-                        """,
-                        (
-                            person_name,
-                            post_label,
-                            country_code_add,
-                            party_add,
-                            thumbnail_add,
-                            current_ts_for_status,
-                            hex_id_to_insert,
-                        ),
-                    )
-                    if cursor.rowcount > 0:
-                        items_added_to_db_this_cycle += 1
-                except psycopg2.Error as e_insert:
-                    logging.error(
-                        f"app.py: PostgreSQL error during initial seeding for "
-                        f"{person_name} ({post_label}): {e_insert}"
-                    )
+            # One pipelined executemany instead of a round trip per row.
+            items_added_to_db_this_cycle = bulk_insert_candidates(
+                conn, all_potential_candidates
+            )
 
             logging.info(
                 f"app.py: [update_queue] Added {items_added_to_db_this_cycle} "
                 f"new items to prayer_candidates."
             )
             cursor.execute(
-                "SELECT COUNT(id) FROM prayer_candidates WHERE status = 'queued'"
+                "SELECT COUNT(id) AS queued_count "
+                "FROM prayer_candidates WHERE status = 'queued'"
             )
-            current_db_candidates_size = (cursor.fetchone() or [0])[0]
+            current_db_candidates_size = cursor.fetchone()["queued_count"]
             logging.info(
                 f"app.py: Initial seeding complete. Current 'queued' items: "
                 f"{current_db_candidates_size}"
@@ -464,18 +474,12 @@ def update_queue():
             conn.commit()
             logging.info("app.py: [update_queue] Database commit successful.")
 
-    except psycopg2.Error as e:
+    except psycopg.Error as e:
         logging.error(f"app.py: [update_queue] PostgreSQL error: {e}", exc_info=True)
-        if conn:
-            conn.rollback()
     except Exception as e_gen:
         logging.error(f"app.py: [update_queue] Critical error: {e_gen}", exc_info=True)
-        if conn:
-            conn.rollback()
     finally:
         logging.info("app.py: [update_queue] Reached finally block.")
-        if conn:
-            conn.close()
 
 
 def load_prayed_for_data_from_db():
@@ -487,13 +491,8 @@ def load_prayed_for_data_from_db():
     for country in COUNTRIES_CONFIG.keys():
         app_prayed_for_data[country] = []  # Initialize/clear country's list
 
-    conn = None
-    if not DATABASE_URL:  # Imported from project.db_utils
-        logging.error("app.py: DATABASE_URL not set, cannot load prayed for data.")
-        return
     try:
-        conn = get_db_conn()  # From project.db_utils
-        with conn.cursor(cursor_factory=DictCursor) as cursor:
+        with get_db_conn() as conn, conn.cursor() as cursor:
             cursor.execute(
                 "SELECT person_name, post_label, country_code, party, "
                 "thumbnail, status_timestamp AS timestamp, hex_id "
@@ -501,8 +500,7 @@ def load_prayed_for_data_from_db():
             )
             rows = cursor.fetchall()
             loaded_count = 0
-            for row_data in rows:
-                item = dict(row_data)
+            for item in rows:
                 country_code_load = item.get("country_code")
                 if country_code_load in app_prayed_for_data:
                     app_prayed_for_data[country_code_load].append(item)
@@ -512,16 +510,13 @@ def load_prayed_for_data_from_db():
                 f"app.py: Loaded {loaded_count} 'prayed' items from PostgreSQL "
                 f"into current_app.prayed_for_data."
             )
-    except psycopg2.Error as e:
+    except psycopg.Error as e:
         logging.error(f"app.py: PostgreSQL error in load_prayed_for_data_from_db: {e}")
     except Exception as e_gen:
         logging.error(
             f"app.py: Unexpected error in " f"load_prayed_for_data_from_db: {e_gen}",
             exc_info=True,
         )
-    finally:
-        if conn:
-            conn.close()
 
 
 def reload_single_country_prayed_data_from_db(country_code_to_reload):
@@ -543,16 +538,8 @@ def reload_single_country_prayed_data_from_db(country_code_to_reload):
     )
     app_prayed_for_data[country_code_to_reload] = []  # Modify list on current_app store
 
-    conn = None
-    if not DATABASE_URL:  # Imported
-        logging.error(
-            f"app.py: DATABASE_URL not set, cannot reload for "
-            f"{country_code_to_reload}."
-        )
-        return
     try:
-        conn = get_db_conn()  # From project.db_utils
-        with conn.cursor(cursor_factory=DictCursor) as cursor:
+        with get_db_conn() as conn, conn.cursor() as cursor:
             cursor.execute(
                 "SELECT person_name, post_label, country_code, party, "
                 "thumbnail, status_timestamp AS timestamp, hex_id "
@@ -561,18 +548,15 @@ def reload_single_country_prayed_data_from_db(country_code_to_reload):
                 (country_code_to_reload,),
             )
             rows = cursor.fetchall()
-            loaded_count = 0
-            for row_data in rows:
-                item = dict(row_data)
-                app_prayed_for_data[country_code_to_reload].append(
-                    item
-                )  # Modify list on current_app store
-                loaded_count += 1
+            app_prayed_for_data[country_code_to_reload].extend(
+                rows
+            )  # Modify list on current_app store
+            loaded_count = len(rows)
             logging.info(
                 f"app.py: Reloaded {loaded_count} 'prayed' items for "
                 f"{country_code_to_reload} into current_app.prayed_for_data."
             )
-    except psycopg2.Error as e:
+    except psycopg.Error as e:
         logging.error(
             f"app.py: PostgreSQL error reloading for " f"{country_code_to_reload}: {e}"
         )
@@ -582,9 +566,6 @@ def reload_single_country_prayed_data_from_db(country_code_to_reload):
             f"{country_code_to_reload}: {e_gen}",
             exc_info=True,
         )
-    finally:
-        if conn:
-            conn.close()
 
 
 # Note: The original app.py had Flask routes. These are assumed to be in blueprints.
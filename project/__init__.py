@@ -11,7 +11,7 @@ import os
 # from .services import prayer_service # Example
 
 
-def create_app():
+def create_app(test_config=None):
     app = Flask(__name__, instance_relative_config=True)
 
     # Configuration
@@ -22,6 +22,9 @@ def create_app():
     from .config import get_config
 
     app.config.from_object(get_config())
+    # Overrides from the caller (tests), applied before anything reads config
+    if test_config is not None:
+        app.config.update(test_config)
 
     # Ensure instance_path exists (though not heavily used yet)
     try:
@@ -80,6 +83,14 @@ def create_app():
     # These are placeholders; their management will be refactored.
     app.hex_map_data_store = {}
     app.post_label_mappings_store = {}
+    # Pre-rendered base map rasters per country (see map_service.cache_base_map)
+    app.base_map_store = {}
+    # Hexagon bounds, centroids and lookups per country (see map_service.cache_hex_geometry)
+    app.hex_bounds_store = {}
+    app.hex_centroid_store = {}
+    app.hex_index_store = {}
+    # Frozenset of every hex id on each country's map (see map_service.cache_hex_geometry)
+    app.hex_id_sets = {}
     # Initialize deputies_data for each country
     countries_keys = app.config.get("COUNTRIES_CONFIG", {}).keys()
     app.deputies_data = {
@@ -87,6 +98,16 @@ def create_app():
     }
     # Initialize prayed_for_data for each country
     app.prayed_for_data = {country: [] for country in countries_keys}
+    # Flat party -> short_name lookup per country, with "Other" always present
+    # as the fallback for parties missing from PARTY_INFO
+    app.party_short_name_maps = {}
+    for country, country_party_info in app.config.get("PARTY_INFO", {}).items():
+        short_map = {
+            party_name: party_details["short_name"]
+            for party_name, party_details in country_party_info.items()
+        }
+        short_map.setdefault("Other", "Other")
+        app.party_short_name_maps[country] = short_map
     # Note: app.config['COUNTRIES_CONFIG'] is loaded from project.config
     # which imports from project.app_config
 
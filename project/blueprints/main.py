@@ -41,7 +41,7 @@ bp = Blueprint("main", __name__)
 @bp.route("/generate_map_direct/<country_code>")
 def generate_map_for_country_direct(country_code):
     current_app.logger.debug(
-        f"[main.bp] Direct map generation for country: {country_code}"
+        "[main.bp] Direct map generation for country: %s", country_code
     )
     if country_code not in current_app.config["COUNTRIES_CONFIG"]:
         current_app.logger.error(
@@ -54,10 +54,9 @@ def generate_map_for_country_direct(country_code):
     post_label_df = current_app.post_label_mappings_store.get(country_code)
 
     # Use prayer_service to get prayed and queued items
-    prayed_list_for_map = prayer_service.get_prayed_representatives(
-        country_code=country_code
+    prayed_list_for_map, current_queue_for_map = prayer_service.get_map_items(
+        country_code
     )
-    current_queue_for_map = prayer_service.get_queued_representatives()
 
     if hex_map_gdf is None or hex_map_gdf.empty:
         current_app.logger.error(
@@ -115,12 +114,14 @@ def home():
         current_item_display.get("person_name") if current_item_display else "None"
     )
     current_app.logger.debug(
-        f"Home page: Displaying map for {map_to_display_country}. "
-        f"Current item: {person_name_display}"
+        "Home page: Displaying map for %s. Current item: %s",
+        map_to_display_country,
+        person_name_display,
     )
 
+    # Uncapped: every prayed row on this map gets its heart
     prayed_for_map_country = prayer_service.get_prayed_representatives(
-        country_code=map_to_display_country
+        country_code=map_to_display_country, limit=None
     )
 
     map_service.generate_country_map_image(
@@ -161,10 +162,9 @@ def generate_map_for_country_json_route(country_code):
         )
         return jsonify(error="Invalid country code", map_image_path=None), 404
 
-    prayed_for_map_country = prayer_service.get_prayed_representatives(
-        country_code=country_code
+    prayed_for_map_country, current_queue_items = prayer_service.get_map_items(
+        country_code
     )
-    current_queue_items = prayer_service.get_queued_representatives()
 
     success = map_service.generate_country_map_image(
         country_code, prayed_for_map_country, current_queue_items
@@ -178,7 +178,7 @@ def generate_map_for_country_json_route(country_code):
 
     if success:
         current_app.logger.debug(
-            f"Map for {country_code} generated, path: {map_image_path}"
+            "Map for %s generated, path: %s", country_code, map_image_path
         )
         return (
             jsonify(
@@ -1,6 +1,7 @@
 from flask import (
     Blueprint,
     render_template,
+    stream_template,
     current_app,
     redirect,
     url_for,
@@ -79,13 +80,12 @@ def process_item_htmx():
             )
 
         # Fetch data for the map based on the determined map_country_code
-        prayed_for_map_data = prayer_service.get_prayed_representatives(
-            country_code=map_country_code
-        )
         # current_queue_items_for_map is used by map_service to show other potential prayer points.
         # It can remain fetching all queued items, or be filtered for map_country_code if preferred.
         # For now, keeping existing behaviour of fetching all.
-        current_queue_items_for_map = prayer_service.get_queued_representatives()
+        prayed_for_map_data, current_queue_items_for_map = prayer_service.get_map_items(
+            map_country_code
+        )
 
         map_service.generate_country_map_image(
             map_country_code,
@@ -221,11 +221,9 @@ def put_back_htmx():
             f"New hex_id (if any): {new_hex_id_to_assign}"
         )
 
-        prayed_list_for_country_updated = prayer_service.get_prayed_representatives(
-            country_code=country_code_form
+        prayed_list_for_country_updated, current_queue_items_for_map = (
+            prayer_service.get_map_items(country_code_form)
         )
-
-        current_queue_items_for_map = prayer_service.get_queued_representatives()
         map_service.generate_country_map_image(
             country_code_form,
             prayed_list_for_country_updated,
@@ -235,21 +233,19 @@ def put_back_htmx():
         prayed_items_display = []
         country_party_info = current_app.config["PARTY_INFO"].get(country_code_form, {})
         other_party_default = {"short_name": "Other", "color": "#CCCCCC"}
-        for item_iter in prayed_list_for_country_updated:
-            item_copy = item_iter.copy()
-            item_copy["formatted_timestamp"] = format_pretty_timestamp(
-                item_copy.get("timestamp")
-            )
-            party_name_from_log = item_copy.get("party", "Other")
+        # Rows are fresh dicts from the query, so they are annotated in place.
+        for item in prayed_list_for_country_updated:
+            item["formatted_timestamp"] = format_pretty_timestamp(item.get("timestamp"))
+            party_name_from_log = item.get("party", "Other")
             party_data = country_party_info.get(
                 party_name_from_log,
                 country_party_info.get("Other", other_party_default),
             )
-            item_copy["party_class"] = (
+            item["party_class"] = (
                 party_data["short_name"].lower().replace(" ", "-").replace("&", "and")
             )
-            item_copy["party_color"] = party_data["color"]
-            prayed_items_display.append(item_copy)
+            item["party_color"] = party_data["color"]
+            prayed_items_display.append(item)
 
         updated_list_html = render_template(
             "partials/_prayed_list_table.html",
@@ -317,10 +313,9 @@ def process_item_form():
         )
         country_code = processed_item_details["country_code"]
         # Regenerate map for the affected country
-        prayed_for_map_country = prayer_service.get_prayed_representatives(
-            country_code=country_code
+        prayed_for_map_country, current_queue_items_for_map = (
+            prayer_service.get_map_items(country_code)
         )
-        current_queue_items_for_map = prayer_service.get_queued_representatives()
         map_service.generate_country_map_image(
             country_code,
             prayed_for_map_country,
@@ -405,10 +400,9 @@ def put_back_form():
             f"Successfully put item ID {candidate_id} back in queue via form."
         )
         # Regenerate map
-        prayed_list_updated = prayer_service.get_prayed_representatives(
-            country_code=country_code_form
+        prayed_list_updated, current_queue_items = prayer_service.get_map_items(
+            country_code_form
         )
-        current_queue_items = prayer_service.get_queued_representatives()
         map_service.generate_country_map_image(
             country_code_form, prayed_list_updated, current_queue_items
         )
@@ -422,29 +416,32 @@ def put_back_form():
     )
 
 
+def _iter_overall_prayed_display_items():
+    """
+    Yields every prayed row, most recent first, annotated for prayed.html.
+    Rows come from a server-side cursor and go straight to the streamed
+    template, so the full history is never held in memory.
+    """
+    countries_config = current_app.config["COUNTRIES_CONFIG"]
+    for display_item in prayer_service.iter_prayed_representatives(country_code=None):
+        item_country_code = display_item.get("country_code")
+        if item_country_code and item_country_code in countries_config:
+            display_item["country_name_display"] = countries_config[item_country_code][
+                "name"
+            ]
+        else:
+            display_item["country_name_display"] = "Unknown Country"
+        display_item["formatted_timestamp"] = format_pretty_timestamp(
+            display_item.get("timestamp")
+        )
+        yield display_item
+
+
 @bp.route("/prayed_list_page/<country_code>")
 def prayed_list_page_html(country_code):
     if country_code == "overall":
-        overall_prayed_list_display = []
-        prayed_items_all = prayer_service.get_prayed_representatives(country_code=None)
-        prayed_items_all.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        for item_iter in prayed_items_all:
-            display_item = item_iter.copy()
-            item_country_code = display_item.get("country_code")
-            if (
-                item_country_code
-                and item_country_code in current_app.config["COUNTRIES_CONFIG"]
-            ):
-                display_item["country_name_display"] = current_app.config[
-                    "COUNTRIES_CONFIG"
-                ][item_country_code]["name"]
-            else:
-                display_item["country_name_display"] = "Unknown Country"
-            display_item["formatted_timestamp"] = format_pretty_timestamp(
-                item_iter.get("timestamp")
-            )
-            overall_prayed_list_display.append(display_item)
-        prayed_for_list_to_render = overall_prayed_list_display
+        # Consumed while the response is streamed (see stream_template below)
+        prayed_for_list_to_render = _iter_overall_prayed_display_items()
         current_country_name = "Overall"
     elif country_code not in current_app.config["COUNTRIES_CONFIG"]:
         current_app.logger.warning(
@@ -464,11 +461,8 @@ def prayed_list_page_html(country_code):
         )
         other_party_default = {"short_name": "Other", "color": "#CCCCCC"}
         prayed_list_display_specific = []
-        for item_original_iter in prayed_items_for_country:
-            item = item_original_iter.copy()
-            item["formatted_timestamp"] = format_pretty_timestamp(
-                item_original_iter.get("timestamp")
-            )
+        for item in prayed_items_for_country:
+            item["formatted_timestamp"] = format_pretty_timestamp(item.get("timestamp"))
             party_name_from_log = item.get("party", "Other")
             party_data = current_country_party_info.get(
                 party_name_from_log,
@@ -485,7 +479,8 @@ def prayed_list_page_html(country_code):
         ]
 
     now = datetime.now()
-    return render_template(
+    # Streamed, so the overall page renders rows as the cursor yields them.
+    return stream_template(
         "prayed.html",
         prayed_for_list=prayed_for_list_to_render,
         country_code=country_code,
@@ -82,12 +82,12 @@ def statistics_default_redirect():
 
 @bp.route("/data/<country_code>")
 def statistics_data_json(country_code):
-    current_app.logger.debug(f"Statistics data JSON requested for: {country_code}")
+    current_app.logger.debug("Statistics data JSON requested for: %s", country_code)
 
     if country_code == "overall":
         total_prayed_count = prayer_service.get_overall_prayed_count()
         data_to_return = {"Overall": total_prayed_count}
-        current_app.logger.debug(f"Overall statistics data: {data_to_return}")
+        current_app.logger.debug("Overall statistics data: %s", data_to_return)
         return jsonify(data_to_return)
 
     if country_code not in current_app.config["COUNTRIES_CONFIG"]:
@@ -100,14 +100,14 @@ def statistics_data_json(country_code):
     party_counts_dict = dict(sorted_party_counts_list)  # Convert list of tuples to dict
 
     current_app.logger.debug(
-        f"Party statistics data for {country_code}: {party_counts_dict}"
+        "Party statistics data for %s: %s", country_code, party_counts_dict
     )
     return jsonify(party_counts_dict)
 
 
 @bp.route("/timedata/<country_code>")
 def statistics_timedata_json(country_code):
-    current_app.logger.debug(f"Statistics timedata JSON requested for: {country_code}")
+    current_app.logger.debug("Statistics timedata JSON requested for: %s", country_code)
 
     if (
         country_code != "overall"
@@ -134,6 +134,8 @@ def statistics_timedata_json(country_code):
         "country_name": current_country_name_for_response,
     }
     current_app.logger.debug(
-        f"Timedata for {country_code} prepared: {len(response_data['timestamps'])} entries."
+        "Timedata for %s prepared: %d entries.",
+        country_code,
+        len(response_data["timestamps"]),
     )
     return jsonify(response_data)
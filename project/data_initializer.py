@@ -1,6 +1,3 @@
-import os
-import pandas as pd
-
 # Import functions from 'app.py' (now using new utils internally)
 # Data stores (HEX_MAP_DATA_STORE etc.) are initialized in project/__init__.py on app instance
 # and populated here by setting attributes on app_instance.
@@ -15,7 +12,7 @@ from app import (
 # Import configs from project.app_config
 from project.app_config import COUNTRIES_CONFIG
 
-from hex_map import load_hex_map, load_post_label_mapping  # These are from root level
+from project.services.map_service import load_all_map_data
 
 
 def _populate_static_stores(app_instance):
@@ -33,6 +30,16 @@ def _populate_static_stores(app_instance):
         app_instance.post_label_mappings_store = {}
     if not hasattr(app_instance, "deputies_data"):
         app_instance.deputies_data = {}
+    if not hasattr(app_instance, "base_map_store"):
+        app_instance.base_map_store = {}
+    if not hasattr(app_instance, "hex_bounds_store"):
+        app_instance.hex_bounds_store = {}
+    if not hasattr(app_instance, "hex_centroid_store"):
+        app_instance.hex_centroid_store = {}
+    if not hasattr(app_instance, "hex_index_store"):
+        app_instance.hex_index_store = {}
+    if not hasattr(app_instance, "hex_id_sets"):
+        app_instance.hex_id_sets = {}
 
     for country_code in COUNTRIES_CONFIG.keys():  # Use imported COUNTRIES_CONFIG
         app_instance.logger.debug(
@@ -85,34 +92,9 @@ def _populate_static_stores(app_instance):
                     "without_images": [],
                 }
 
-        # HEX_MAP_DATA_STORE on app_instance
-        map_path = COUNTRIES_CONFIG[country_code]["map_shape_path"]
-        if os.path.exists(map_path):
-            app_instance.hex_map_data_store[country_code] = load_hex_map(map_path)
-            app_instance.logger.debug(
-                f"Loaded hex map for {country_code} onto app_instance."
-            )
-        else:
-            app_instance.logger.error(
-                f"Map file not found: {map_path} for {country_code}"
-            )
-            app_instance.hex_map_data_store[country_code] = None
-
-        # POST_LABEL_MAPPINGS_STORE on app_instance
-        post_label_path = COUNTRIES_CONFIG[country_code].get("post_label_mapping_path")
-        if post_label_path and os.path.exists(post_label_path):
-            app_instance.post_label_mappings_store[country_code] = (
-                load_post_label_mapping(post_label_path)
-            )
-            app_instance.logger.debug(
-                f"Loaded post label mapping for {country_code} onto app_instance."
-            )
-        else:
-            app_instance.post_label_mappings_store[country_code] = pd.DataFrame()
-            if post_label_path:
-                app_instance.logger.warning(
-                    f"Post label mapping file not found: {post_label_path} for {country_code}."
-                )
+    # Map GeoJSON and post label CSVs for every country, read in parallel,
+    # followed by the per-country geometry and base map caches
+    load_all_map_data(app_instance.app_context())
 
 
 def initialize_application(
@@ -125,7 +107,8 @@ def initialize_application(
     # DATABASE_URL is now sourced by project.db_utils from os.environ
     # init_db (from app.py) will use project.db_utils.get_db_conn()
     # which in turn uses project.db_utils.DATABASE_URL.
-    # A check for DATABASE_URL's existence is done in project.db_utils.
+    # A missing DATABASE_URL raises at import of project.db_utils (pulled in
+    # via app.py above), so none of the steps below run without a database.
 
     # 1. Initialize Database Schema
     # init_db (from app.py) internally uses get_db_conn from project.db_utils
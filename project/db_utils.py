@@ -1,34 +1,104 @@
+import atexit
+from contextlib import contextmanager
 import os
-import psycopg2
+import threading
+import psycopg
+from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 import logging
 
 # DATABASE_URL will be fetched from environment variables
 DATABASE_URL = os.environ.get("DATABASE_URL")
 
+# Set PRAYREPS_ALLOW_NO_DB=1 to import this module without a database
+# (e.g. for tooling or tests that never open a connection).
+ALLOW_NO_DB = os.environ.get("PRAYREPS_ALLOW_NO_DB") == "1"
+
 if not DATABASE_URL:
-    # This logging might occur at import time, which is generally okay for critical configs.
-    # However, app-level logging (current_app.logger) isn't available here directly.
-    # Using standard Python logging.
-    logging.error(
-        "CRITICAL: project.db_utils - DATABASE_URL environment variable not set at import time."
+    if not ALLOW_NO_DB:
+        # Fail fast: without a database the app cannot serve anything, so there
+        # is no point in loading CSVs/GeoJSON or building the queue first.
+        raise RuntimeError("DATABASE_URL not set")
+    logging.warning(
+        "project.db_utils - DATABASE_URL not set; continuing because "
+        "PRAYREPS_ALLOW_NO_DB=1."
+    )
+
+# Connection pool bounds; one gunicorn worker rarely needs more than a few.
+DB_POOL_MINCONN = int(os.environ.get("DB_POOL_MINCONN", "2"))
+DB_POOL_MAXCONN = int(os.environ.get("DB_POOL_MAXCONN", "20"))
+
+# Optional synchronous_commit override for the app's own connections. Unset,
+# the server's setting (normally "on") applies. "off" lets a commit return
+# before its WAL record is flushed, so a server crash can lose the last few
+# hundred milliseconds of acknowledged prayers; only opt in knowingly.
+DB_SYNCHRONOUS_COMMIT = os.environ.get("DB_SYNCHRONOUS_COMMIT")
+
+# Created on first use, so importing this module never opens a connection.
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _configure_conn(conn):
+    """Applies per-session settings to each new pooled connection."""
+    if not DB_SYNCHRONOUS_COMMIT:
+        return
+    conn.execute(
+        "SELECT set_config('synchronous_commit', %s, false)",
+        (DB_SYNCHRONOUS_COMMIT,),
     )
-    # Depending on desired behavior, could raise an error or allow None to be handled by consumers.
-    # For now, functions using it will need to check.
+    conn.commit()  # The pool only accepts idle connections
 
 
+def _get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # Every connection hands out dict rows, so callers index
+                # columns by name without choosing a cursor factory.
+                _pool = ConnectionPool(
+                    DATABASE_URL,
+                    min_size=DB_POOL_MINCONN,
+                    max_size=DB_POOL_MAXCONN,
+                    kwargs={"row_factory": dict_row},
+                    configure=_configure_conn,
+                    open=True,
+                )
+                logging.info(
+                    f"project.db_utils - Opened PostgreSQL connection pool "
+                    f"({DB_POOL_MINCONN}-{DB_POOL_MAXCONN} connections)."
+                )
+    return _pool
+
+
+@atexit.register
+def close_pool():
+    """Closes every pooled connection (registered to run at interpreter exit)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+@contextmanager
 def get_db_conn():
-    """Establishes a connection to the PostgreSQL database."""
+    """
+    Borrows a connection from the PostgreSQL pool for the duration of a
+    ``with`` block. Rows come back as dicts. The transaction is rolled back if
+    the block raises, committed otherwise, and the connection is always
+    returned to the pool (broken connections are discarded by the pool).
+    """
     if not DATABASE_URL:
-        # Logged at import, but good to check again if function is called when it was None.
-        logging.error(
-            "project.db_utils.get_db_conn - DATABASE_URL is not set. Cannot connect to the database."
-        )
+        # Only reachable when PRAYREPS_ALLOW_NO_DB=1 bypassed the import check.
         raise ValueError("DATABASE_URL not configured")
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        return conn
-    except psycopg2.Error as e:
+        pool = _get_pool()
+    except psycopg.Error as e:
         logging.error(
             f"project.db_utils.get_db_conn - Error connecting to PostgreSQL database: {e}"
         )
         raise
+    with pool.connection() as conn:
+        yield conn
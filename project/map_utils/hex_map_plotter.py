@@ -1,13 +1,22 @@
 import matplotlib
 import logging
+import functools
 import geopandas as gpd
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.patches import Polygon
+import shapely
+import matplotlib.artist as martist
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from matplotlib.transforms import Bbox
 from matplotlib.offsetbox import AnnotationBbox, OffsetImage
 from PIL import Image, ImageFile
 import random
 import os
+import threading
 import time
 
 # must select backend before importing pyplot
@@ -23,12 +32,25 @@ PROJECT_ROOT_DIR = os.path.dirname(PROJECT_DIR)
 STATIC_FOLDER_PATH = os.path.join(PROJECT_ROOT_DIR, "static")
 HEART_ICONS_DIR = os.path.join(STATIC_FOLDER_PATH, "heart_icons")
 DEFAULT_MAP_OUTPUT_FILENAME = "hex_map.png"
+MAP_DPI = 100
+MAP_PAD_INCHES = 0.5
+# Axes area of a default 10x10 inch subplot, which the maps were designed at.
+MAP_AXES_BOX_INCHES = (7.75, 7.7)
+# zlib level for map PNGs: ~30% larger files, several times faster to encode.
+MAP_PNG_COMPRESS_LEVEL = 1
+
+# Heart icons decoded once per process, keyed by thumbnail size.
+_HEART_CACHE = {}
+_HEART_CACHE_LOCK = threading.Lock()
+
+# One reusable map Figure (and its heart OffsetImages) per worker thread.
+_MAP_FIGURE_TLS = threading.local()
 
 
 def load_hex_map_data(hex_map_geojson_path):
     try:
         hex_map = gpd.read_file(hex_map_geojson_path)
-        logger.debug(f"Successfully loaded GeoJSON from: {hex_map_geojson_path}")
+        logger.debug("Successfully loaded GeoJSON from: %s", hex_map_geojson_path)
         return hex_map
     except Exception as e:
         logger.error(
@@ -41,7 +63,8 @@ def load_post_label_mapping_data(post_label_mapping_csv_path):
     try:
         post_label_mapping = pd.read_csv(post_label_mapping_csv_path)
         logger.debug(
-            f"Successfully loaded post label mapping CSV from: {post_label_mapping_csv_path}"
+            "Successfully loaded post label mapping CSV from: %s",
+            post_label_mapping_csv_path,
         )
         return post_label_mapping
     except Exception as e:
@@ -52,28 +75,366 @@ def load_post_label_mapping_data(post_label_mapping_csv_path):
         return pd.DataFrame()
 
 
-def _load_random_heart_image(size=(25, 25)):
+@functools.lru_cache(maxsize=1)
+def _heart_files():
+    """Sorted heart PNG filenames, scanned from HEART_ICONS_DIR once per process."""
     if not os.path.isdir(HEART_ICONS_DIR):
         logger.error(f"Heart icons directory not found: {HEART_ICONS_DIR}")
-        return None
+        return ()
 
-    heart_pngs = [f for f in os.listdir(HEART_ICONS_DIR) if f.endswith(".png")]
+    heart_pngs = tuple(
+        sorted(f for f in os.listdir(HEART_ICONS_DIR) if f.endswith(".png"))
+    )
     if not heart_pngs:
         logger.error(f"No PNG images found in heart icons directory: {HEART_ICONS_DIR}")
-        return None
+    return heart_pngs
+
+
+def _load_heart_images(size):
+    heart_images = []
+    for heart_png in _heart_files():
+        heart_path = os.path.join(HEART_ICONS_DIR, heart_png)
+        try:
+            heart_img = Image.open(heart_path).convert("RGBA")
+            heart_img.thumbnail(size, Image.Resampling.LANCZOS)
+            heart_images.append(heart_img)
+        except Exception as e:
+            logger.error(f"Error loading heart image {heart_path}: {e}")
+    logger.debug("Cached %d heart images at size %s.", len(heart_images), size)
+    return heart_images
+
+
+def _get_heart_cache(size=(25, 25)):
+    """Returns the decoded heart thumbnails for `size`, loading them on first use.
+
+    OffsetImage only reads the pixel data, so the same PIL images can be
+    shared by every heart on every map.
+    """
+    with _HEART_CACHE_LOCK:
+        heart_images = _HEART_CACHE.get(size)
+        if not heart_images:
+            heart_images = _load_heart_images(size)
+            if heart_images:
+                _HEART_CACHE[size] = heart_images
+        return heart_images
+
+
+def preload_heart_icons(size=(25, 25)):
+    """Decodes the heart icons into the process cache; returns how many loaded.
+
+    Called at startup so the first map request does not pay for the decode,
+    and so a missing or empty icons directory is reported once up front.
+    """
+    return len(_get_heart_cache(size))
+
+
+def _first_match_lookup(keys, values):
+    """Builds a key -> value dict keeping the first occurrence of each key.
+
+    Matches the previous `df[df[col] == key].iloc[0]` lookups, which also
+    returned the first matching row.
+    """
+    lookup = {}
+    for key, value in zip(keys, values):
+        lookup.setdefault(key, value)
+    return lookup
+
+
+def _get_map_figure():
+    """Returns this thread's reusable (fig, ax) with the axes cleared.
+
+    The Figure sits directly on a FigureCanvasAgg instead of going through
+    pyplot, so it is never registered with (or closed through) pyplot and
+    its Agg buffer is reused by every render on the thread.
+    """
+    fig = getattr(_MAP_FIGURE_TLS, "fig", None)
+    if fig is None:
+        fig = Figure(figsize=(10, 10), dpi=MAP_DPI)
+        FigureCanvasAgg(fig)
+        fig.add_subplot(1, 1, 1)
+        _MAP_FIGURE_TLS.fig = fig
+        _MAP_FIGURE_TLS.heart_imageboxes = []
+    ax = fig.axes[0]
+    ax.clear()
+    return fig, ax
+
+
+def _discard_map_figure():
+    """Drops this thread's figure so a failed render cannot leak into the next."""
+    _MAP_FIGURE_TLS.fig = None
+    _MAP_FIGURE_TLS.heart_imageboxes = []
+
+
+def _get_heart_imageboxes(size=(25, 25), zoom=0.6):
+    """Returns one OffsetImage per cached heart icon for this thread's figure.
+
+    An OffsetImage can be shared by any number of artists in the same figure,
+    but matplotlib refuses to move an artist to another figure, so the pool
+    lives alongside the thread's reusable figure.
+    """
+    if not _MAP_FIGURE_TLS.heart_imageboxes:
+        _MAP_FIGURE_TLS.heart_imageboxes = [
+            OffsetImage(heart_img, zoom=zoom) for heart_img in _get_heart_cache(size)
+        ]
+    return _MAP_FIGURE_TLS.heart_imageboxes
+
+
+class _HeartLayer(martist.Artist):
+    """Draws every heart on a map as a single artist.
+
+    Hearts that share an icon share one OffsetImage, which is moved to each
+    of its data positions at draw time. Placement matches
+    AnnotationBbox(imagebox, xy, frameon=False), without paying for one
+    AnnotationBbox (and its frame patch) per heart.
+    """
+
+    zorder = AnnotationBbox.zorder
+
+    def __init__(self, heart_groups):
+        """`heart_groups` is a list of (OffsetImage, xs, ys) in data coordinates."""
+        super().__init__()
+        self._heart_groups = heart_groups
+        # OffsetImages ignore the clip box when drawn; keep the layer in the
+        # tight bbox computation like AnnotationBbox is.
+        self.set_clip_on(False)
+
+    def set_figure(self, fig):
+        for imagebox, _, _ in self._heart_groups:
+            imagebox.set_figure(fig)
+        super().set_figure(fig)
+
+    def _placed_imageboxes(self, renderer):
+        """Yields each heart's OffsetImage after centring it on its position."""
+        for imagebox, xs, ys in self._heart_groups:
+            bbox = imagebox.get_bbox(renderer)
+            for x_px, y_px in self.axes.transData.transform(np.column_stack([xs, ys])):
+                imagebox.set_offset(
+                    (
+                        x_px - 0.5 * bbox.width - bbox.x0,
+                        y_px - 0.5 * bbox.height - bbox.y0,
+                    )
+                )
+                yield imagebox
+
+    def get_window_extent(self, renderer=None):
+        if renderer is None:
+            renderer = self.figure._get_renderer()
+        extents = [
+            imagebox.get_window_extent(renderer)
+            for imagebox in self._placed_imageboxes(renderer)
+        ]
+        return Bbox.union(extents) if extents else Bbox.null()
+
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+        renderer.open_group(self.__class__.__name__, gid=self.get_gid())
+        for imagebox in self._placed_imageboxes(renderer):
+            imagebox.draw(renderer)
+        renderer.close_group(self.__class__.__name__)
+        self.stale = False
+
+
+def _exterior_rings_path(geometry):
+    """Returns one Path tracing every exterior ring of a (Multi)Polygon.
+
+    All vertices come out of a single shapely.get_coordinates call; each ring
+    starts with MOVETO and ends with CLOSEPOLY so one PathPatch draws them all.
+    """
+    rings = shapely.get_exterior_ring(shapely.get_parts(geometry))
+    coords, ring_index = shapely.get_coordinates(rings, return_index=True)
+    codes = np.full(len(coords), Path.LINETO, dtype=Path.code_type)
+    ring_starts = np.flatnonzero(np.diff(ring_index, prepend=-1))
+    codes[ring_starts] = Path.MOVETO
+    codes[np.append(ring_starts[1:], len(coords)) - 1] = Path.CLOSEPOLY
+    return Path(coords, codes)
+
+
+def _fit_figure_to_axes(fig, ax, keep_aspect=True):
+    """Sizes `fig` to the axes box plus MAP_PAD_INCHES on every side.
+
+    This is the image savefig(bbox_inches="tight", pad_inches=0.5) used to
+    produce from a 10x10 figure, laid out up front so saving does not need
+    the extra draw pass that the tight bbox costs. With `keep_aspect` the box
+    is shrunk to the equal-aspect data limits, as set_aspect("equal") did.
+    """
+    box_width, box_height = MAP_AXES_BOX_INCHES
+    if keep_aspect:
+        x_min, x_max = ax.get_xlim()
+        y_min, y_max = ax.get_ylim()
+        data_aspect = (x_max - x_min) / (y_max - y_min)
+        if data_aspect >= box_width / box_height:
+            box_height = box_width / data_aspect
+        else:
+            box_width = box_height * data_aspect
+    fig_width = box_width + 2 * MAP_PAD_INCHES
+    fig_height = box_height + 2 * MAP_PAD_INCHES
+    if tuple(fig.get_size_inches()) != (fig_width, fig_height):
+        fig.set_size_inches(fig_width, fig_height)
+    ax.set_position(
+        [
+            MAP_PAD_INCHES / fig_width,
+            MAP_PAD_INCHES / fig_height,
+            box_width / fig_width,
+            box_height / fig_height,
+        ]
+    )
 
-    chosen_heart_path = os.path.join(HEART_ICONS_DIR, random.choice(heart_pngs))
-    logger.debug(f"Loading random heart image from: {chosen_heart_path}")
-    try:
-        heart_img = Image.open(chosen_heart_path).convert("RGBA")
-        heart_img.thumbnail(size)
-        return heart_img
-    except FileNotFoundError:
-        logger.error(f"Heart image file not found: {chosen_heart_path}")
-        return None
-    except Exception as e:
-        logger.error(f"Error loading heart image {chosen_heart_path}: {e}")
-        return None
+
+def _save_map_figure(fig, output_path):
+    fig.savefig(
+        output_path,
+        dpi=MAP_DPI,
+        pil_kwargs={"compress_level": MAP_PNG_COMPRESS_LEVEL},
+    )
+
+
+def _save_placeholder(output_path, message):
+    """Saves a text-only placeholder map on this thread's reusable figure."""
+    fig, ax = _get_map_figure()
+    fig.patch.set_facecolor("white")
+    ax.text(0.5, 0.5, message, ha="center", va="center", fontsize=16, color="red")
+    ax.set_axis_off()
+    _fit_figure_to_axes(fig, ax, keep_aspect=False)
+    _save_map_figure(fig, output_path)
+
+
+def _prepare_map_axes(hex_map_gdf, country_code, base_map=None, bounds=None):
+    """Sets up this thread's map figure with the per-country padding; returns (fig, ax).
+
+    The hexagon layer is drawn as vectors, or blitted from `base_map` (the
+    (raster, extent) pair from build_base_map) when one is given. `bounds`
+    is the cached total_bounds of the hexagons, computed here if omitted.
+    """
+    fig, ax = _get_map_figure()
+    fig.patch.set_facecolor("white")
+    ax.set_facecolor("white")
+    if base_map is not None:
+        base_raster, base_extent = base_map
+        ax.imshow(base_raster, extent=base_extent, interpolation="nearest", zorder=0)
+    else:
+        # Same look as hex_map_gdf.plot(color="white", edgecolor="lightgrey")
+        polygons = shapely.get_parts(hex_map_gdf.geometry.to_numpy())
+        ax.add_collection(
+            PolyCollection(
+                [
+                    shapely.get_coordinates(ring)
+                    for ring in shapely.get_exterior_ring(polygons)
+                ],
+                facecolor="white",
+                edgecolor="lightgrey",
+                linewidth=1.0,
+            )
+        )
+    ax.set_axis_off()
+
+    if bounds is None:
+        bounds = hex_map_gdf.geometry.total_bounds
+    width = bounds[2] - bounds[0]
+    height = bounds[3] - bounds[1]
+
+    # Define a padding factor to adjust perceived size.
+    # Larger padding makes the content appear smaller within the frame.
+    padding_factor_x = 0.1  # Default 10% horizontal padding
+    padding_factor_y = 0.1  # Default 10% vertical padding
+
+    if country_code == "israel":
+        logger.debug(
+            "Applying increased padding for Israel map to reduce its relative size."
+        )
+        padding_factor_x = 0.25  # Increase horizontal padding for Israel
+        padding_factor_y = 0.25  # Increase vertical padding for Israel
+    elif country_code == "iran":
+        # Optionally, slightly reduce padding for Iran if it needs to appear larger
+        # For now, keep it at the default or slightly less if Israel is the main concern
+        padding_factor_x = 0.05
+        padding_factor_y = 0.05
+        logger.debug("Applying standard/reduced padding for Iran map.")
+
+    ax.set_xlim(
+        bounds[0] - width * padding_factor_x, bounds[2] + width * padding_factor_x
+    )
+    ax.set_ylim(
+        bounds[1] - height * padding_factor_y, bounds[3] + height * padding_factor_y
+    )
+    ax.set_aspect("equal")
+    _fit_figure_to_axes(fig, ax)
+    return fig, ax
+
+
+def build_hex_index(hex_map_gdf, post_label_mapping_df=None):
+    """Builds the lookups plot_hex_map_with_hearts resolves items through.
+
+    Returns {"id_to_row", "name_to_row", "label_to_name"}: hex id and region
+    name to row position in hex_map_gdf (which also indexes the cached
+    centroids), and post_label to region name. Each is a dict lookup instead
+    of a boolean mask over the whole frame, and depends only on static data,
+    so it is built once per country at load time.
+    """
+    hex_rows = range(len(hex_map_gdf))
+    id_to_row = (
+        _first_match_lookup(hex_map_gdf["id"].to_numpy(), hex_rows)
+        if "id" in hex_map_gdf.columns
+        else {}
+    )
+    name_to_row = (
+        _first_match_lookup(hex_map_gdf["name"].to_numpy(), hex_rows)
+        if "name" in hex_map_gdf.columns
+        else {}
+    )
+    label_to_name = {}
+    if (
+        post_label_mapping_df is not None
+        and not post_label_mapping_df.empty
+        and all(col in post_label_mapping_df.columns for col in ["post_label", "name"])
+    ):
+        label_to_name = _first_match_lookup(
+            post_label_mapping_df["post_label"].to_numpy(),
+            post_label_mapping_df["name"].to_numpy(),
+        )
+    return {
+        "id_to_row": id_to_row,
+        "name_to_row": name_to_row,
+        "label_to_name": label_to_name,
+    }
+
+
+def compute_hex_centroids(hex_geometries):
+    """Returns an (N, 2) array of centroid x/y for an array of geometries.
+
+    Uses the vectorised shapely ufuncs, so the whole array is one GEOS loop.
+    Rows stay aligned with the input (empty geometries give NaN).
+    """
+    centroids = shapely.centroid(hex_geometries)
+    return np.column_stack([shapely.get_x(centroids), shapely.get_y(centroids)])
+
+
+def build_base_map(hex_map_gdf, country_code, outline_px=2):
+    """Renders the static hexagon layer once; returns (rgba_array, extent).
+
+    Drawing every hexagon is the bulk of a render, so the layer is rasterised
+    at the output size and cropped to the hexagons (plus `outline_px` for the
+    edge lines). `extent` is the crop in data coordinates, ready for
+    ax.imshow, so each request blits one image instead of N polygons.
+    """
+    fig, ax = _prepare_map_axes(hex_map_gdf, country_code)
+    fig.canvas.draw()
+    rgba = np.asarray(fig.canvas.buffer_rgba())
+    canvas_height, canvas_width = rgba.shape[:2]
+    bounds = hex_map_gdf.geometry.total_bounds
+    (left, bottom), (right, top) = ax.transData.transform(
+        [(bounds[0], bounds[1]), (bounds[2], bounds[3])]
+    )
+    # Whole pixels, so the raster lands back on the same pixel grid.
+    left = max(int(np.floor(left)) - outline_px, 0)
+    bottom = max(int(np.floor(bottom)) - outline_px, 0)
+    right = min(int(np.ceil(right)) + outline_px, canvas_width)
+    top = min(int(np.ceil(top)) + outline_px, canvas_height)
+    raster = rgba[canvas_height - top : canvas_height - bottom, left:right].copy()
+    (x0, y0), (x1, y1) = ax.transData.inverted().transform(
+        [(left, bottom), (right, top)]
+    )
+    return raster, (x0, x1, y0, y1)
 
 
 def plot_hex_map_with_hearts(
@@ -84,33 +445,26 @@ def plot_hex_map_with_hearts(
     country_code,
     output_dir=STATIC_FOLDER_PATH,
     output_filename=DEFAULT_MAP_OUTPUT_FILENAME,
+    base_map=None,
+    hex_bounds=None,
+    hex_centroids=None,
+    hex_index=None,
 ):
     output_path = os.path.join(output_dir, output_filename)
     logger.debug(
-        f"Plotting hex map for country {country_code}. "
-        f"Prayed: {len(prayed_for_items_list)}, Queue: {len(queue_items_list)}. "
-        f"Output: {output_path}"
+        "Plotting hex map for country %s. Prayed: %d, Queue: %d. Output: %s",
+        country_code,
+        len(prayed_for_items_list),
+        len(queue_items_list),
+        output_path,
     )
 
     if hex_map_gdf is None or hex_map_gdf.empty:
         logger.error(
             f"Cannot plot map for {country_code}: hex_map_gdf is None or empty."
         )
-        fig_err_placeholder, ax_err_placeholder = plt.subplots(
-            1, 1, figsize=(10, 10)
-        )  # Renamed variables
-        ax_err_placeholder.text(
-            0.5,
-            0.5,
-            f"Map data unavailable\nfor {country_code}",
-            ha="center",
-            va="center",
-            fontsize=16,
-            color="red",
-        )
-        ax_err_placeholder.set_axis_off()
         try:
-            plt.savefig(output_path, bbox_inches="tight", pad_inches=0.5, dpi=100)
+            _save_placeholder(output_path, f"Map data unavailable\nfor {country_code}")
             logger.info(
                 f"Saved placeholder map to {output_path} due to missing map data for {country_code}."
             )
@@ -118,8 +472,7 @@ def plot_hex_map_with_hearts(
             logger.error(
                 f"Failed to save placeholder map for {country_code}: {e_save_placeholder}"
             )
-        finally:
-            plt.close(fig_err_placeholder)
+            _discard_map_figure()
         return
 
     is_random_allocation_country = country_code in ["israel", "iran"]
@@ -128,158 +481,161 @@ def plot_hex_map_with_hearts(
         logger.error(
             f"'id' column missing in hex_map_gdf for random allocation country {country_code}. Saving base map."
         )
-        fig_base_map = None  # Renamed variable
         try:
-            fig_base_map, ax_base_map = plt.subplots(
-                1, 1, figsize=(10, 10)
-            )  # Renamed variables
-            fig_base_map.patch.set_facecolor("white")
-            ax_base_map.set_facecolor("white")
-            hex_map_gdf.plot(ax=ax_base_map, color="white", edgecolor="lightgrey")
-            ax_base_map.set_axis_off()
-            bounds_base = hex_map_gdf.geometry.total_bounds
+            fig_base_map, ax_base_map = _prepare_map_axes(
+                hex_map_gdf, country_code, base_map, hex_bounds
+            )
+            # Unpadded: just the hexagons, as this fallback has always shown.
+            bounds_base = (
+                hex_bounds if hex_bounds is not None else hex_map_gdf.total_bounds
+            )
             ax_base_map.set_xlim(bounds_base[0], bounds_base[2])
             ax_base_map.set_ylim(bounds_base[1], bounds_base[3])
-            ax_base_map.set_aspect("equal")
-            plt.savefig(output_path, bbox_inches="tight", pad_inches=0.5, dpi=100)
+            _fit_figure_to_axes(fig_base_map, ax_base_map)
+            _save_map_figure(fig_base_map, output_path)
         except Exception as e_save_no_id:
             logger.error(
                 f"Failed to save base map for {country_code} (no 'id' column): {e_save_no_id}"
             )
-        finally:
-            if fig_base_map is not None:
-                plt.close(fig_base_map)
+            _discard_map_figure()
         return
 
-    fig_main_plot = None  # Renamed variable
     try:
-        fig_main_plot, ax_main_plot = plt.subplots(
-            1, 1, figsize=(10, 10)
-        )  # Renamed variables
-        fig_main_plot.patch.set_facecolor("white")
-        ax_main_plot.set_facecolor("white")
-        hex_map_gdf.plot(ax=ax_main_plot, color="white", edgecolor="lightgrey")
-        ax_main_plot.set_axis_off()
-
-        bounds = hex_map_gdf.geometry.total_bounds
-        width = bounds[2] - bounds[0]
-        height = bounds[3] - bounds[1]
-
-        # Define a padding factor to adjust perceived size.
-        # Larger padding makes the content appear smaller within the frame.
-        padding_factor_x = 0.1  # Default 10% horizontal padding
-        padding_factor_y = 0.1  # Default 10% vertical padding
+        fig_main_plot, ax_main_plot = _prepare_map_axes(
+            hex_map_gdf, country_code, base_map, hex_bounds
+        )
 
-        if country_code == "israel":
-            logger.debug(
-                "Applying increased padding for Israel map to reduce its relative size."
-            )
-            padding_factor_x = 0.25  # Increase horizontal padding for Israel
-            padding_factor_y = 0.25  # Increase vertical padding for Israel
-        elif country_code == "iran":
-            # Optionally, slightly reduce padding for Iran if it needs to appear larger
-            # For now, keep it at the default or slightly less if Israel is the main concern
-            padding_factor_x = 0.05
-            padding_factor_y = 0.05
-            logger.debug("Applying standard/reduced padding for Iran map.")
-
-        ax_main_plot.set_xlim(
-            bounds[0] - width * padding_factor_x, bounds[2] + width * padding_factor_x
+        hex_geometries = hex_map_gdf.geometry.to_numpy()
+        if hex_index is None:
+            hex_index = build_hex_index(hex_map_gdf, post_label_mapping_df)
+        id_to_row = hex_index["id_to_row"]
+        name_to_row = hex_index["name_to_row"]
+        label_to_name = hex_index["label_to_name"]
+        # Column/mapping checks are per map, not per item; evaluate them once.
+        has_id_column = "id" in hex_map_gdf.columns
+        has_name_column = "name" in hex_map_gdf.columns
+        has_mapping_rows = (
+            post_label_mapping_df is not None and not post_label_mapping_df.empty
         )
-        ax_main_plot.set_ylim(
-            bounds[1] - height * padding_factor_y, bounds[3] + height * padding_factor_y
+        has_mapping_columns = has_mapping_rows and all(
+            col in post_label_mapping_df.columns for col in ["post_label", "name"]
         )
-        ax_main_plot.set_aspect("equal")
 
+        heart_imageboxes = _get_heart_imageboxes()
         placed_heart_count = 0
-        for prayed_item_iter in prayed_for_items_list:  # Renamed loop variable
-            if prayed_item_iter.get("country_code") != country_code:
-                continue
-            location_geom = None
-            item_identifier_for_log = prayed_item_iter.get(
-                "person_name", "Unknown Person"
-            )
-
-            if is_random_allocation_country:
-                assigned_hex_id = prayed_item_iter.get("hex_id")
-                if assigned_hex_id and "id" in hex_map_gdf.columns:
-                    geom_series = hex_map_gdf[hex_map_gdf["id"] == assigned_hex_id]
-                    if not geom_series.empty:
-                        location_geom = geom_series.geometry.iloc[0]
-                    else:
-                        logger.warning(
-                            f"Geometry not found for assigned hex ID {assigned_hex_id} "
-                            f"for {item_identifier_for_log} in {country_code}."
-                        )
-                else:
-                    logger.warning(
-                        f"Prayed item {item_identifier_for_log} for {country_code} "
-                        f"(random alloc) has no/invalid assigned hex_id."
-                    )
+        local_prayed_items = [
+            item
+            for item in prayed_for_items_list
+            if item.get("country_code") == country_code
+        ]
+        # Resolve every item to a hex row in a few vectorised steps (each
+        # Series.map over a dict is a hash join); only misses are looped over
+        # for logging.
+        local_items_df = pd.DataFrame.from_records(
+            local_prayed_items, columns=["person_name", "hex_id", "post_label"]
+        )
+        person_names = local_items_df["person_name"].fillna("Unknown Person")
+        located = pd.Series(np.nan, index=local_items_df.index)
+
+        if is_random_allocation_country:
+            # An 'id' column is guaranteed here (checked above).
+            assigned_hex_ids = local_items_df["hex_id"]
+            has_hex_id = assigned_hex_ids.notna() & (assigned_hex_ids != "")
+            located = assigned_hex_ids.where(has_hex_id).map(id_to_row)
+            for assigned_hex_id, item_identifier_for_log in zip(
+                assigned_hex_ids[has_hex_id & located.isna()],
+                person_names[has_hex_id & located.isna()],
+            ):
+                logger.warning(
+                    f"Geometry not found for assigned hex ID {assigned_hex_id} "
+                    f"for {item_identifier_for_log} in {country_code}."
+                )
+            for item_identifier_for_log in person_names[~has_hex_id]:
+                logger.warning(
+                    f"Prayed item {item_identifier_for_log} for {country_code} "
+                    f"(random alloc) has no/invalid assigned hex_id."
+                )
+        elif local_prayed_items:
+            if not has_mapping_rows:
+                logger.error(
+                    f"Post label mapping is missing/empty for {country_code} "
+                    f"(specific mapping). Cannot place {len(local_prayed_items)} hearts."
+                )
+            elif not has_mapping_columns:
+                logger.error(
+                    f"Required columns ('post_label', 'name') not in post_label_mapping_df for {country_code}."
+                )
+            elif not has_name_column:
+                logger.error(
+                    f"'name' column (for hex region ID) missing in hex_map_gdf "
+                    f"for {country_code} (specific mapping)."
+                )
             else:
-                if post_label_mapping_df is None or post_label_mapping_df.empty:
-                    logger.error(
-                        f"Post label mapping is missing/empty for {country_code} "
-                        f"(specific mapping). Cannot place heart for {item_identifier_for_log}."
-                    )
-                    continue
-                if not all(
-                    col in post_label_mapping_df.columns
-                    for col in ["post_label", "name"]
-                ):
-                    logger.error(
-                        f"Required columns ('post_label', 'name') not in post_label_mapping_df for {country_code}."
-                    )
-                    continue
-                if "name" not in hex_map_gdf.columns:
-                    logger.error(
-                        f"'name' column (for hex region ID) missing in hex_map_gdf "
-                        f"for {country_code} (specific mapping)."
-                    )
-                    continue
-                item_post_label = prayed_item_iter.get("post_label")
-                if item_post_label:
-                    code_series = post_label_mapping_df.loc[
-                        post_label_mapping_df["post_label"] == item_post_label, "name"
-                    ]
-                    if not code_series.empty:
-                        hex_region_name = code_series.iloc[0]
-                        geom_series = hex_map_gdf[
-                            hex_map_gdf["name"] == hex_region_name
-                        ]
-                        if not geom_series.empty:
-                            location_geom = geom_series.geometry.iloc[0]
+                item_post_labels = local_items_df["post_label"]
+                has_post_label = item_post_labels.notna() & (item_post_labels != "")
+                hex_region_names = item_post_labels.where(has_post_label).map(
+                    label_to_name
+                )
+                located = hex_region_names.map(name_to_row)
+                if logger.isEnabledFor(logging.DEBUG):
+                    for (
+                        item_post_label,
+                        hex_region_name,
+                        item_identifier_for_log,
+                    ) in zip(
+                        item_post_labels[located.isna()],
+                        hex_region_names[located.isna()],
+                        person_names[located.isna()],
+                    ):
+                        if pd.isna(item_post_label) or item_post_label == "":
+                            logger.debug(
+                                "Prayed item %s has no post_label for specific mapping in %s.",
+                                item_identifier_for_log,
+                                country_code,
+                            )
+                        elif pd.isna(hex_region_name):
+                            logger.debug(
+                                "No mapping found for post_label %s in %s.",
+                                item_post_label,
+                                country_code,
+                            )
                         else:
                             logger.debug(
-                                f"No geometry for hex region name {hex_region_name} "
-                                f"(from label {item_post_label}) in {country_code}."
+                                "No geometry for hex region name %s (from label %s) in %s.",
+                                hex_region_name,
+                                item_post_label,
+                                country_code,
                             )
-                    else:
-                        logger.debug(
-                            f"No mapping found for post_label {item_post_label} in {country_code}."
-                        )
-                else:
-                    logger.debug(
-                        f"Prayed item {item_identifier_for_log} has no post_label "
-                        f"for specific mapping in {country_code}."
-                    )
 
-            if location_geom:
-                centroid = location_geom.centroid
-                heart_img = _load_random_heart_image(size=(25, 25))
-                if heart_img:
-                    imagebox = OffsetImage(heart_img, zoom=0.6)
-                    ab = AnnotationBbox(
-                        imagebox, (centroid.x, centroid.y), frameon=False
-                    )
-                    ax_main_plot.add_artist(ab)  # Use ax_main_plot
-                    placed_heart_count += 1
-                else:
-                    logger.warning(
-                        f"Skipping heart for {item_identifier_for_log} in {country_code} "
-                        f"(heart image load failed)."
+        located_rows = located.dropna().to_numpy(dtype=np.intp)
+        located_rows = located_rows[~shapely.is_empty(hex_geometries[located_rows])]
+
+        if len(located_rows) and not heart_imageboxes:
+            logger.warning(
+                f"Skipping {len(located_rows)} hearts in {country_code} "
+                f"(heart image load failed)."
+            )
+        elif len(located_rows):
+            if hex_centroids is not None:
+                centroid_xs, centroid_ys = hex_centroids[located_rows].T
+            else:
+                # One vectorised GEOS call for all hearts instead of .centroid per item.
+                centroid_xs, centroid_ys = compute_hex_centroids(
+                    hex_geometries[located_rows]
+                ).T
+            heart_choices = np.array(
+                random.choices(range(len(heart_imageboxes)), k=len(located_rows))
+            )
+            heart_groups = []
+            for heart_index, imagebox in enumerate(heart_imageboxes):
+                chosen = heart_choices == heart_index
+                if chosen.any():
+                    heart_groups.append(
+                        (imagebox, centroid_xs[chosen], centroid_ys[chosen])
                     )
-        logger.debug(f"Placed {placed_heart_count} hearts for {country_code}.")
+            ax_main_plot.add_artist(_HeartLayer(heart_groups))  # Use ax_main_plot
+            placed_heart_count = len(located_rows)
+        logger.debug("Placed %s hearts for %s.", placed_heart_count, country_code)
 
         if queue_items_list:
             top_queue_item = queue_items_list[0]
@@ -287,20 +643,16 @@ def plot_hex_map_with_hearts(
                 logger.info(
                     f"Attempting to highlight top queue item for {country_code}: {top_queue_item.get('person_name')}"
                 )
-                highlight_geom = None
+                highlight_row = None
                 item_identifier_for_log_q = top_queue_item.get(
                     "person_name", "Unknown Queued Person"
                 )
 
                 if is_random_allocation_country:
                     assigned_hex_id_q = top_queue_item.get("hex_id")
-                    if assigned_hex_id_q and "id" in hex_map_gdf.columns:
-                        geom_series_q = hex_map_gdf[
-                            hex_map_gdf["id"] == assigned_hex_id_q
-                        ]
-                        if not geom_series_q.empty:
-                            highlight_geom = geom_series_q.geometry.iloc[0]
-                        else:
+                    if assigned_hex_id_q and has_id_column:
+                        highlight_row = id_to_row.get(assigned_hex_id_q)
+                        if highlight_row is None:
                             logger.warning(
                                 f"Highlight failed for {country_code}: Assigned hex ID "
                                 f"{assigned_hex_id_q} for {item_identifier_for_log_q} "
@@ -312,30 +664,13 @@ def plot_hex_map_with_hearts(
                             f"(random alloc) has no/invalid assigned hex_id for highlighting."
                         )
                 else:
-                    if (
-                        post_label_mapping_df is not None
-                        and not post_label_mapping_df.empty
-                        and all(
-                            col in post_label_mapping_df.columns
-                            for col in ["post_label", "name"]
-                        )
-                        and "name" in hex_map_gdf.columns
-                    ):
+                    if has_mapping_columns and has_name_column:
                         top_queue_post_label = top_queue_item.get("post_label")
                         if top_queue_post_label:
-                            code_series_q = post_label_mapping_df.loc[
-                                post_label_mapping_df["post_label"]
-                                == top_queue_post_label,
-                                "name",
-                            ]
-                            if not code_series_q.empty:
-                                hex_region_name_q = code_series_q.iloc[0]
-                                geom_series_q = hex_map_gdf[
-                                    hex_map_gdf["name"] == hex_region_name_q
-                                ]
-                                if not geom_series_q.empty:
-                                    highlight_geom = geom_series_q.geometry.iloc[0]
-                                else:
+                            hex_region_name_q = label_to_name.get(top_queue_post_label)
+                            if hex_region_name_q is not None:
+                                highlight_row = name_to_row.get(hex_region_name_q)
+                                if highlight_row is None:
                                     logger.warning(
                                         f"No geometry for hex region name {hex_region_name_q} "
                                         f"for specific queue highlighting in {country_code}."
@@ -356,47 +691,29 @@ def plot_hex_map_with_hearts(
                             f"(map data or mapping df issues)."
                         )
 
-                if highlight_geom:
-
-                    def add_geometry_patches(
-                        ax_to_plot_on, geometry, **kwargs
-                    ):  # Renamed ax argument
-                        if geometry.geom_type == "Polygon":
-                            ax_to_plot_on.add_patch(
-                                Polygon(geometry.exterior.coords, closed=True, **kwargs)
-                            )
-                        elif geometry.geom_type == "MultiPolygon":
-                            for poly_geom_iter in list(
-                                geometry.geoms
-                            ):  # Renamed loop variable
-                                ax_to_plot_on.add_patch(
-                                    Polygon(
-                                        poly_geom_iter.exterior.coords,
-                                        closed=True,
-                                        **kwargs,
-                                    )
-                                )
-
-                    add_geometry_patches(
-                        ax_main_plot,
-                        highlight_geom,
-                        edgecolor="black",
-                        facecolor="yellow",
-                        alpha=0.7,
-                        linewidth=2.5,
+                if highlight_row is not None and hex_geometries[highlight_row]:
+                    ax_main_plot.add_patch(
+                        PathPatch(
+                            _exterior_rings_path(hex_geometries[highlight_row]),
+                            edgecolor="black",
+                            facecolor="yellow",
+                            alpha=0.7,
+                            linewidth=2.5,
+                        )
                     )  # Use ax_main_plot
                     logger.info(
                         f"Successfully highlighted hex for {item_identifier_for_log_q} in {country_code}."
                     )
             else:
                 logger.debug(
-                    f"Top queue item country '{top_queue_item.get('country_code')}' "
-                    f"does not match current map country '{country_code}'. No highlight."
+                    "Top queue item country '%s' does not match current map country '%s'. No highlight.",
+                    top_queue_item.get("country_code"),
+                    country_code,
                 )
         else:
             logger.debug("Queue is empty. Nothing to highlight.")
 
-        plt.savefig(output_path, bbox_inches="tight", pad_inches=0.5, dpi=100)
+        _save_map_figure(fig_main_plot, output_path)
         logger.info(f"Successfully saved map to {output_path}")
 
     except Exception as e_plot:
@@ -404,24 +721,12 @@ def plot_hex_map_with_hearts(
             f"An unexpected error occurred during map plotting for {country_code}: {e_plot}",
             exc_info=True,
         )
-        if fig_main_plot is not None:
-            plt.close(fig_main_plot)
-        fig_err_handling = None  # Renamed variable
+        _discard_map_figure()
         try:
-            fig_err_handling, ax_err_handling = plt.subplots(
-                1, 1, figsize=(10, 10)
-            )  # Renamed variables
-            ax_err_handling.text(
-                0.5,
-                0.5,
+            _save_placeholder(
+                output_path,
                 f"Error generating map\nfor {country_code}.\nPlease check logs.",
-                ha="center",
-                va="center",
-                fontsize=16,
-                color="red",
             )
-            ax_err_handling.set_axis_off()
-            plt.savefig(output_path, bbox_inches="tight", pad_inches=0.5, dpi=100)
             logger.info(
                 f"Saved error placeholder map for {country_code} to {output_path} due to plotting exception."
             )
@@ -429,19 +734,16 @@ def plot_hex_map_with_hearts(
             logger.error(
                 f"Failed to save generic error placeholder map for {country_code}: {e_save_generic_error}"
             )
-        finally:
-            if fig_err_handling is not None:
-                plt.close(fig_err_handling)
-    finally:
-        if fig_main_plot is not None:
-            plt.close(fig_main_plot)
+            _discard_map_figure()
 
     if os.path.exists(output_path):
         try:
             mod_time_after = os.path.getmtime(output_path)
             logger.debug(
-                f"File {output_path} exists after save attempt. "
-                f"Last modified: {time.ctime(mod_time_after)} (Timestamp: {mod_time_after})"
+                "File %s exists after save attempt. Last modified: %s (Timestamp: %s)",
+                output_path,
+                time.ctime(mod_time_after),
+                mod_time_after,
             )
         except Exception as e_stat_after:  # Renamed variable
             logger.error(
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from flask import current_app
 import os
 import logging  # Using current_app.logger
@@ -37,6 +38,18 @@ except ImportError as e:
         def plot_hex_map_with_hearts(self, *args, **kwargs):
             pass
 
+        def build_base_map(self, *args, **kwargs):
+            return None
+
+        def compute_hex_centroids(self, *args, **kwargs):
+            return None
+
+        def build_hex_index(self, *args, **kwargs):
+            return None
+
+        def preload_heart_icons(self, *args, **kwargs):
+            return 0
+
     hex_map_plotter = DummyHexMapPlotter()
 
 
@@ -52,13 +65,31 @@ def load_all_map_data(app_context):
         current_app.logger.info("Loading all map data...")
         countries_config = current_app.config["COUNTRIES_CONFIG"]
 
+        # File reads and GeoJSON parsing are independent per country, so they
+        # run on a thread pool; results are stored on this thread below.
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(8, 2 * len(countries_config)))
+        ) as executor:
+            hex_map_futures = {}
+            post_label_futures = {}
+            for country_code, config in countries_config.items():
+                if os.path.exists(config["map_shape_path"]):
+                    hex_map_futures[country_code] = executor.submit(
+                        hex_map_plotter.load_hex_map_data, config["map_shape_path"]
+                    )
+                post_label_path = config.get("post_label_mapping_path")
+                if post_label_path and os.path.exists(post_label_path):
+                    post_label_futures[country_code] = executor.submit(
+                        hex_map_plotter.load_post_label_mapping_data, post_label_path
+                    )
+
         for country_code, config in countries_config.items():
             # Load map shape data (GeoJSON)
             map_path = config["map_shape_path"]
-            if os.path.exists(map_path):
-                current_app.hex_map_data_store[country_code] = (
-                    hex_map_plotter.load_hex_map_data(map_path)
-                )  # Updated function call
+            if country_code in hex_map_futures:
+                current_app.hex_map_data_store[country_code] = hex_map_futures[
+                    country_code
+                ].result()  # Updated function call
                 if (
                     current_app.hex_map_data_store[country_code] is not None
                     and not current_app.hex_map_data_store[country_code].empty
@@ -88,9 +119,9 @@ def load_all_map_data(app_context):
 
             # Load post label mapping data (CSV for non-random countries)
             post_label_path = config.get("post_label_mapping_path")
-            if post_label_path and os.path.exists(post_label_path):
+            if country_code in post_label_futures:
                 current_app.post_label_mappings_store[country_code] = (
-                    hex_map_plotter.load_post_label_mapping_data(post_label_path)
+                    post_label_futures[country_code].result()
                 )  # Updated function call
                 if not current_app.post_label_mappings_store[country_code].empty:
                     current_app.logger.info(
@@ -110,14 +141,85 @@ def load_all_map_data(app_context):
                 )  # Assign empty DataFrame
             else:  # No path specified (e.g., for Israel, Iran using random hex allocation)
                 current_app.logger.debug(
-                    f"No post label mapping file specified for {country_code}. Using empty DataFrame."
+                    "No post label mapping file specified for %s. Using empty DataFrame.",
+                    country_code,
                 )
                 current_app.post_label_mappings_store[country_code] = (
                     pd.DataFrame()
                 )  # Assign empty DataFrame
+
+            cache_hex_geometry(country_code)
+            cache_base_map(country_code)
+        preload_heart_icons()
         current_app.logger.info("Finished loading all map data.")
 
 
+def cache_hex_geometry(country_code):
+    """
+    Stores the hexagons' total bounds, per-row centroids, id/name/post_label
+    lookups and set of hex ids for a country in current_app.hex_bounds_store,
+    hex_centroid_store, hex_index_store and hex_id_sets. They depend only on
+    the loaded GeoDataFrame and post label mapping, so map requests and hex
+    assignment reuse them instead of recomputing.
+    Call after both have been loaded.
+    """
+    hex_map_gdf = current_app.hex_map_data_store.get(country_code)
+    if hex_map_gdf is None or hex_map_gdf.empty:
+        current_app.hex_bounds_store[country_code] = None
+        current_app.hex_centroid_store[country_code] = None
+        current_app.hex_index_store[country_code] = None
+        current_app.hex_id_sets[country_code] = frozenset()
+        return
+    current_app.hex_id_sets[country_code] = (
+        frozenset(hex_map_gdf["id"].astype(str).tolist())
+        if "id" in hex_map_gdf.columns
+        else frozenset()
+    )
+    hex_geometries = hex_map_gdf.geometry.to_numpy()
+    current_app.hex_bounds_store[country_code] = hex_map_gdf.geometry.total_bounds
+    current_app.hex_centroid_store[country_code] = (
+        hex_map_plotter.compute_hex_centroids(hex_geometries)
+    )
+    current_app.hex_index_store[country_code] = hex_map_plotter.build_hex_index(
+        hex_map_gdf, current_app.post_label_mappings_store.get(country_code)
+    )
+
+
+def cache_base_map(country_code):
+    """
+    Renders the static hexagon layer for a country once and stores it in
+    current_app.base_map_store, so each map request only draws hearts on top.
+    """
+    hex_map_gdf = current_app.hex_map_data_store.get(country_code)
+    if hex_map_gdf is None or hex_map_gdf.empty:
+        current_app.base_map_store[country_code] = None
+        return
+    try:
+        current_app.base_map_store[country_code] = hex_map_plotter.build_base_map(
+            hex_map_gdf, country_code
+        )
+        current_app.logger.debug("Cached base map raster for %s.", country_code)
+    except Exception as e:
+        current_app.logger.error(
+            f"Failed to cache base map for {country_code}: {e}", exc_info=True
+        )
+        current_app.base_map_store[country_code] = None
+
+
+def preload_heart_icons():
+    """
+    Decodes the heart icons once at startup. Maps are still drawn without
+    hearts if none load, so this is where that gets reported.
+    """
+    heart_count = hex_map_plotter.preload_heart_icons()
+    if heart_count:
+        current_app.logger.info(f"Preloaded {heart_count} heart icons.")
+    else:
+        current_app.logger.error(
+            "No heart icons could be loaded; maps will be drawn without hearts."
+        )
+
+
 # --- Map Plotting ---
 
 
@@ -132,6 +234,10 @@ def generate_country_map_image(country_code, prayed_for_items_list, queue_items_
 
     hex_map_gdf = current_app.hex_map_data_store.get(country_code)
     post_label_df = current_app.post_label_mappings_store.get(country_code)
+    base_map = current_app.base_map_store.get(country_code)
+    hex_bounds = current_app.hex_bounds_store.get(country_code)
+    hex_centroids = current_app.hex_centroid_store.get(country_code)
+    hex_index = current_app.hex_index_store.get(country_code)
 
     # Define output path - this is where plot_hex_map_with_hearts will save the image.
     # hex_map.py saves to os.path.join(APP_ROOT, 'static', "hex_map.png")
@@ -168,6 +274,10 @@ def generate_country_map_image(country_code, prayed_for_items_list, queue_items_
             queue_items_list,
             country_code,
             # heart_img_path is handled by hex_map.py's load_random_heart_image
+            base_map=base_map,
+            hex_bounds=hex_bounds,
+            hex_centroids=hex_centroids,
+            hex_index=hex_index,
         )
         current_app.logger.info(
             f"Successfully generated and saved map image for {country_code}."
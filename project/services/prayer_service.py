@@ -1,243 +1,467 @@
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
 from flask import current_app
 from datetime import datetime
+import os
 import pandas as pd
-import numpy as np
-import random
-import psycopg2  # For PostgreSQL
-from psycopg2.extras import DictCursor  # To fetch rows as dictionaries
+import threading
+import time
+import psycopg  # For PostgreSQL; pooled connections return dict rows
+
+try:
+    import pyarrow  # noqa: F401  # Optional: multithreaded parsing of large CSVs
+
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
 
 # Import from new utility modules within the 'project' package
-from ..db_utils import get_db_conn, DATABASE_URL
+from ..db_utils import get_db_conn
+
+# Default cap for get_prayed_representatives on the per-country list pages.
+# Maps pass limit=None, since every prayed row needs its heart; long
+# histories should use iter_prayed_representatives.
+PRAYED_LIST_LIMIT = 5000
+# Rows per round trip when streaming prayed rows through a server-side cursor.
+PRAYED_ITER_BATCH = 1000
+
+# Party counts and the overall prayed count are read on every dashboard and
+# home page render but only change when a prayer is marked or undone, so they
+# are reused for up to STATS_CACHE_TTL_SECONDS. Writers call
+# _clear_stats_cache(); the TTL bounds staleness across gunicorn workers.
+# A plain dict behind a lock: there is one key per country plus the overall
+# count, so cachetools.TTLCache would add a dependency for two methods.
+STATS_CACHE_TTL_SECONDS = 15
+# Backstop only: the stats routes already reject unconfigured country codes.
+STATS_CACHE_MAX_ENTRIES = 64
+_stats_cache = {}  # key -> (expires_at, value)
+_stats_cache_lock = threading.Lock()
+# Bumped by every clear, so a read that raced a write does not store its
+# pre-write value after the clear (see _set_cached_stat).
+_stats_cache_generation = 0
+
+# --- SQL statements ---
+# Built once at import so every call passes psycopg the same string, which is
+# what its prepared-statement cache keys on.
+
+# Column lists per status; the 'prayed' one matches the INCLUDE list of
+# idx_pc_prayed_country_ts (see app.init_db).
+_CANDIDATE_COLUMNS = {
+    "queued": """id, person_name, post_label, country_code, party, thumbnail,
+                 initial_add_timestamp AS added_timestamp, hex_id, status_timestamp""",
+    "prayed": """id, person_name, post_label, country_code, party, thumbnail,
+                 status_timestamp AS timestamp, hex_id""",
+}
+
+_SQL_INSERT_CANDIDATE = """
+    INSERT INTO prayer_candidates
+        (person_name, post_label, country_code, party,
+         thumbnail, status, status_timestamp, hex_id)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (person_name, post_label, country_code) DO NOTHING
+"""
+
+# The WHERE clause is the "exists and is queued" check, and RETURNING hands
+# back the updated row with its timestamp already formatted for the frontend.
+_SQL_MARK_PRAYED = """
+    UPDATE prayer_candidates
+    SET status = 'prayed', status_timestamp = %s
+    WHERE id = %s AND status = 'queued'
+    RETURNING id, person_name, post_label, country_code, party, thumbnail,
+              hex_id, status,
+              to_char(status_timestamp, 'YYYY-MM-DD HH24:MI:SS') AS timestamp
+"""
+
+# COALESCE keeps the current hex_id when no new one is given.
+_SQL_PUT_BACK_IN_QUEUE = """
+    UPDATE prayer_candidates
+    SET status = 'queued', status_timestamp = %s,
+        hex_id = COALESCE(%s, hex_id)
+    WHERE id = %s AND status = 'prayed'
+    RETURNING hex_id
+"""
+
+# Anti-join of the map's ids (one array parameter) against used ids, with the
+# random pick done in the same statement. The NOT EXISTS probe is served by
+# the partial index idx_pc_hex_in_use (see app.init_db).
+_SQL_PICK_AVAILABLE_HEX_ID = """
+    SELECT m.id AS hex_id FROM unnest(%s::text[]) AS m(id)
+    WHERE NOT EXISTS (
+        SELECT 1 FROM prayer_candidates pc
+        WHERE pc.country_code = %s AND pc.hex_id = m.id
+          AND pc.status IN ('prayed', 'queued') AND pc.id != %s
+    )
+    ORDER BY random()
+    LIMIT 1
+"""
+
+_SQL_PURGE_ALL = "DELETE FROM prayer_candidates"
+
+_SQL_PARTY_COUNTS = """
+    SELECT party, COUNT(*) AS prayed_count FROM prayer_candidates
+    WHERE status = 'prayed' AND country_code = %s
+    GROUP BY party
+"""
+
+_SQL_PRAYED_TIMEDATA = """
+    SELECT post_label, person_name, party, country_code,
+           to_char(status_timestamp, 'YYYY-MM-DD HH24:MI:SS') AS timestamp
+    FROM prayer_candidates
+    WHERE status = 'prayed' AND country_code = ANY(%s)
+    ORDER BY status_timestamp ASC
+"""
+
+_SQL_OVERALL_PRAYED_COUNT = (
+    "SELECT COUNT(*) AS prayed_count FROM prayer_candidates WHERE status = 'prayed'"
+)
+
+
+@lru_cache(maxsize=None)
+def _candidate_query(status, order_by, by_country, limited):
+    """
+    Returns the SELECT for _fetch_candidates / iter_prayed_representatives.
+    Parameters are status, then country_code if by_country, then the limit if
+    limited. Cached, so each of the few query shapes is one string object.
+    """
+    query = f"""
+        SELECT {_CANDIDATE_COLUMNS[status]}
+        FROM prayer_candidates
+        WHERE status = %s
+    """
+    if by_country:
+        query += " AND country_code = %s"
+    query += f" ORDER BY {order_by}"
+    if limited:
+        query += " LIMIT %s"
+    return query
+
+
+def _get_cached_stat(key):
+    """
+    Returns (value, generation): the cached value for key, or None if absent
+    or expired, and the generation to hand back to _set_cached_stat.
+    """
+    with _stats_cache_lock:
+        entry = _stats_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1], _stats_cache_generation
+        return None, _stats_cache_generation
+
+
+def _set_cached_stat(key, value, generation):
+    """
+    Caches value for key unless the cache was cleared since `generation` was
+    read, i.e. a write may have landed after value was queried.
+    """
+    now = time.monotonic()
+    with _stats_cache_lock:
+        if generation != _stats_cache_generation:
+            return
+        if len(_stats_cache) >= STATS_CACHE_MAX_ENTRIES:
+            for stale_key in [
+                k for k, (expires_at, _) in _stats_cache.items() if expires_at <= now
+            ]:
+                del _stats_cache[stale_key]
+            if len(_stats_cache) >= STATS_CACHE_MAX_ENTRIES:
+                _stats_cache.clear()
+        _stats_cache[key] = (now + STATS_CACHE_TTL_SECONDS, value)
+
+
+def _clear_stats_cache():
+    global _stats_cache_generation
+    with _stats_cache_lock:
+        _stats_cache.clear()
+        _stats_cache_generation += 1
+
+
+@contextmanager
+def _use_conn(conn=None):
+    """
+    Yields the caller's connection if one is given, else borrows one from the
+    pool. A failed statement leaves a PostgreSQL transaction unusable, so a
+    caller's connection is rolled back on error before the next query runs.
+    """
+    if conn is not None:
+        try:
+            yield conn
+        except psycopg.Error:
+            conn.rollback()
+            raise
+    else:
+        with get_db_conn() as pooled_conn:
+            yield pooled_conn
+
 
 # --- Data Fetching and Processing (from original app.py, to be adapted) ---
 
+# The only CSV columns anything downstream reads ("place" is not one of them).
+CSV_COLUMNS = ("post_label", "person_name", "party", "image_url")
+# Below this size the C parser beats pyarrow's thread start-up (the bundled
+# country files are a few kB), so pyarrow is only used for larger files.
+PYARROW_MIN_CSV_BYTES = 1024 * 1024
+
+
+def read_representatives_csv(csv_path):
+    """
+    pd.read_csv restricted to CSV_COLUMNS (any that are missing are simply
+    absent) and read as plain object columns, which skips pandas' per-column
+    type inference. Large files are instead parsed by the multithreaded
+    pyarrow engine when it is installed.
+    """
+    if HAVE_PYARROW and os.path.getsize(csv_path) >= PYARROW_MIN_CSV_BYTES:
+        # pyarrow takes no callable usecols, so match against the header.
+        # Its own column types are kept: converting to object is what makes
+        # the C path slow on big files, and nan_to_none handles either.
+        header = pd.read_csv(csv_path, nrows=0).columns
+        return pd.read_csv(
+            csv_path,
+            engine="pyarrow",
+            usecols=[column for column in CSV_COLUMNS if column in header],
+        )
+    return pd.read_csv(
+        csv_path, usecols=lambda column: column in CSV_COLUMNS, dtype=object
+    )
+
+
+def nan_to_none(df):
+    """
+    Returns df with every missing cell (NaN/NA) as None, for the database and
+    templates. Only columns that actually have missing values are cast to
+    object and rewritten; the rest are left as they are.
+    """
+    missing_columns = df.columns[df.isna().any()]
+    return df.assign(
+        **{
+            column: df[column].astype(object).where(df[column].notna(), None)
+            for column in missing_columns
+        }
+    )
+
 
 def fetch_csv_data(country_code):
     """Fetches CSV data for a given country."""
     csv_path = current_app.config["COUNTRIES_CONFIG"][country_code]["csv_path"]
     try:
-        df = pd.read_csv(csv_path)
-        df = df.replace({np.nan: None})  # Replace NaN with None for DB compatibility
+        df = read_representatives_csv(csv_path)
+        df = nan_to_none(df)  # Replace NaN with None for DB compatibility
         current_app.logger.debug(
-            f"Successfully fetched {len(df)} rows from {csv_path} for {country_code}."
+            "Successfully fetched %d rows from %s for %s.",
+            len(df),
+            csv_path,
+            country_code,
         )
         return df
     except FileNotFoundError:
-        current_app.logger.error(f"CSV file not found for {country_code} at {csv_path}")
+        current_app.logger.error(
+            "CSV file not found for %s at %s", country_code, csv_path
+        )
         return pd.DataFrame()
     except Exception as e:
         current_app.logger.error(
-            f"Error reading CSV for {country_code} at {csv_path}: {e}"
+            "Error reading CSV for %s at %s: %s", country_code, csv_path, e
         )
         return pd.DataFrame()
 
 
-def process_deputies_from_df(df_country, country_code):
-    """Processes deputies from a DataFrame, separating those with and without images."""
-    # This function was used to populate app.deputies_data
-    # It can be adapted if that global structure is still needed for some views,
-    # or if the data is directly inserted into a more permanent store.
-    # For now, let's assume it populates the app-level store as before.
-
-    deputies_with_images = []
-    deputies_without_images = []
-
-    if df_country.empty:
-        current_app.logger.warning(
-            f"No deputies to process for {country_code} as DataFrame is empty."
-        )
-        return {"with_images": [], "without_images": []}
-
-    for _index, row in df_country.iterrows():
-        image_url = row.get("image_url")
-        processed_row = row.to_dict()
-        if not image_url:
-            deputies_without_images.append(processed_row)
-        else:
-            # In original app.py, 'Image' was added to row. Not strictly needed if 'image_url' is used.
-            # processed_row['Image'] = image_url
-            deputies_with_images.append(processed_row)
-
-    current_app.logger.debug(
-        f"Processed deputies for {country_code}: {len(deputies_with_images)} with, "
-        f"{len(deputies_without_images)} without images."
-    )
-    return {
-        "with_images": deputies_with_images,
-        "without_images": deputies_without_images,
-    }
-
-
 # --- Queue Management (interacting with prayer_candidates table) ---
 
 
-def get_queued_representatives(limit=None):
-    """Gets representatives from the prayer_candidates table with status 'queued' (PostgreSQL)."""
+def _fetch_candidates(status, *, order_by, country_code=None, limit=None, conn=None):
+    """
+    Fetches prayer_candidates rows with the given status as dicts (PostgreSQL).
+    Uses the caller's connection if given, so several reads can share one
+    pool checkout.
+    """
     items = []
-    conn = None
-    if not DATABASE_URL:
-        current_app.logger.error(
-            "DATABASE_URL not set, cannot fetch queued representatives."
-        )
-        return items
     try:
-        conn = get_db_conn()
-        with conn.cursor(cursor_factory=DictCursor) as cursor:
-            query = """
-                SELECT id, person_name, post_label, country_code, party, thumbnail,
-                       initial_add_timestamp AS added_timestamp, hex_id, status_timestamp
-                FROM prayer_candidates
-                WHERE status = 'queued'
-                ORDER BY id ASC
-            """
-            params = []
+        with _use_conn(conn) as conn, conn.cursor() as cursor:
+            query = _candidate_query(status, order_by, bool(country_code), bool(limit))
+            params = [status]
+            if country_code:
+                params.append(country_code)
             if limit:
-                query += " LIMIT %s"
                 params.append(limit)
 
-            cursor.execute(query, tuple(params))
-            rows = cursor.fetchall()
-            items = [dict(row) for row in rows]
+            # Only a handful of query shapes exist, and they run on every
+            # page view, so they are prepared server-side on first use.
+            cursor.execute(query, tuple(params), prepare=True)
+            items = cursor.fetchall()
             current_app.logger.debug(
-                f"Fetched {len(items)} 'queued' representatives (PostgreSQL)."
+                "Fetched %d '%s' representatives (country: %s) (PostgreSQL).",
+                len(items),
+                status,
+                country_code or "all",
             )
-    except psycopg2.Error as e:
-        current_app.logger.error(f"PostgreSQL error in get_queued_representatives: {e}")
+    except psycopg.Error as e:
+        current_app.logger.error(
+            "PostgreSQL error fetching '%s' representatives: %s", status, e
+        )
     except Exception as e_gen:
         current_app.logger.error(
-            f"Unexpected error in get_queued_representatives: {e_gen}", exc_info=True
+            "Unexpected error fetching '%s' representatives: %s",
+            status,
+            e_gen,
+            exc_info=True,
         )
-    finally:
-        if conn:
-            conn.close()
     return items
 
 
-def get_next_queued_representative():
+def get_queued_representatives(limit=None, conn=None):
+    """
+    Gets representatives from the prayer_candidates table with status 'queued' (PostgreSQL).
+    The WHERE/ORDER BY match the partial index idx_pc_queued_id (see app.init_db);
+    keep them aligned if either changes.
+    """
+    return _fetch_candidates("queued", order_by="id ASC", limit=limit, conn=conn)
+
+
+def bulk_insert_candidates(conn, rows):
+    """
+    Inserts candidate dicts (person_name, post_label, country_code, party,
+    thumbnail, hex_id) as 'queued' rows with one executemany call, which
+    psycopg pipelines instead of waiting on each INSERT in turn.
+    Rows that already exist are skipped. Runs in the caller's transaction
+    (no commit) and returns the number of rows actually inserted.
+    """
+    if not rows:
+        return 0
+    now_timestamp = datetime.now()
+    with conn.cursor() as cursor:
+        cursor.executemany(
+            _SQL_INSERT_CANDIDATE,
+            [
+                (
+                    row["person_name"],
+                    row.get("post_label"),
+                    row["country_code"],
+                    row.get("party"),
+                    row.get("thumbnail"),
+                    "queued",
+                    now_timestamp,
+                    row.get("hex_id"),
+                )
+                for row in rows
+            ],
+        )
+        # Summed over every row; conflicting rows count as 0.
+        return cursor.rowcount
+
+
+def get_next_queued_representative(conn=None):
     """Gets the next representative from the queue (oldest by ID) (PostgreSQL)."""
-    items = get_queued_representatives(limit=1)
+    items = get_queued_representatives(limit=1, conn=conn)
     return items[0] if items else None
 
 
-def get_prayed_representatives(country_code=None):
-    """Gets representatives from prayer_candidates with status 'prayed' (PostgreSQL)."""
-    items = []
-    conn = None
-    if not DATABASE_URL:
-        current_app.logger.error(
-            "DATABASE_URL not set, cannot fetch prayed representatives."
+def get_prayed_representatives(country_code=None, conn=None, limit=PRAYED_LIST_LIMIT):
+    """
+    Gets representatives from prayer_candidates with status 'prayed' (PostgreSQL),
+    most recent first and at most `limit` of them (no cap if limit is None).
+    The WHERE/ORDER BY and selected columns match the covering partial index
+    idx_pc_prayed_country_ts (see app.init_db); keep them aligned if either changes.
+    """
+    items = _fetch_candidates(
+        "prayed",
+        order_by="status_timestamp DESC",
+        country_code=country_code,
+        limit=limit,
+        conn=conn,
+    )
+    if limit and len(items) >= limit:
+        current_app.logger.warning(
+            "Prayed list for %s truncated to the %d most recent rows.",
+            country_code or "all countries",
+            limit,
         )
-        return items
-    try:
-        conn = get_db_conn()
-        with conn.cursor(cursor_factory=DictCursor) as cursor:
-            query = """
-                SELECT id, person_name, post_label, country_code, party, thumbnail,
-                       status_timestamp AS timestamp, hex_id
-                FROM prayer_candidates
-                WHERE status = 'prayed'
-            """
-            params = []
-            if country_code:
-                query += " AND country_code = %s"
-                params.append(country_code)
-            query += " ORDER BY status_timestamp DESC"  # Show most recent first
+    return items
+
 
+def iter_prayed_representatives(country_code=None, batch=PRAYED_ITER_BATCH):
+    """
+    Yields the same rows as get_prayed_representatives, without a limit,
+    streamed from a server-side cursor `batch` rows at a time so the full
+    history is never held in memory at once.
+    """
+    query = _candidate_query(
+        "prayed", "status_timestamp DESC", bool(country_code), False
+    )
+    params = ["prayed"]
+    if country_code:
+        params.append(country_code)
+    try:
+        with get_db_conn() as conn, conn.cursor(name="prayed_cur") as cursor:
+            cursor.itersize = batch
             cursor.execute(query, tuple(params))
-            rows = cursor.fetchall()
-            items = [dict(row) for row in rows]
-            current_app.logger.debug(
-                f"Fetched {len(items)} 'prayed' representatives (country: {country_code or 'all'}) (PostgreSQL)."
-            )
-    except psycopg2.Error as e:
-        current_app.logger.error(f"PostgreSQL error in get_prayed_representatives: {e}")
-    except Exception as e_gen:
+            yield from cursor
+    except psycopg.Error as e:
         current_app.logger.error(
-            f"Unexpected error in get_prayed_representatives: {e_gen}", exc_info=True
+            "PostgreSQL error in iter_prayed_representatives: %s", e
         )
-    finally:
-        if conn:
-            conn.close()
-    return items
-
-
-def mark_representative_as_prayed(candidate_id):
-    """Updates a representative's status to 'prayed' (PostgreSQL)."""
-    conn = None
-    if not DATABASE_URL:
+    except Exception as e_gen:
         current_app.logger.error(
-            "DATABASE_URL not set, cannot mark representative as prayed."
+            "Unexpected error in iter_prayed_representatives: %s", e_gen, exc_info=True
         )
-        return None, 0
 
-    now_timestamp = datetime.now()  # Use datetime object for psycopg2
 
+def get_map_items(country_code):
+    """
+    Returns (prayed items for country_code, all queued items), the two lists
+    every map render needs, read on one pooled connection.
+    """
     try:
-        conn = get_db_conn()
-        with conn.cursor(cursor_factory=DictCursor) as cursor:
-            # First, fetch the item to ensure it exists and is queued
-            cursor.execute(
-                "SELECT * FROM prayer_candidates WHERE id = %s AND status = 'queued'",
-                (candidate_id,),
+        with get_db_conn() as conn:
+            return (
+                get_prayed_representatives(country_code, conn, limit=None),
+                get_queued_representatives(conn=conn),
             )
-            item_to_update_row = cursor.fetchone()
+    except psycopg.Error as e:
+        current_app.logger.error("PostgreSQL error in get_map_items: %s", e)
+        return [], []
 
-            if not item_to_update_row:
-                current_app.logger.warning(
-                    f"Attempted to mark item ID {candidate_id} as prayed, but it was not "
-                    f"found or not in 'queued' state (PostgreSQL)."
-                )
-                return None, 0
 
-            item_to_update = dict(item_to_update_row)
+def mark_representative_as_prayed(candidate_id):
+    """Updates a representative's status to 'prayed' (PostgreSQL)."""
+    now_timestamp = datetime.now()  # Sent as a binary timestamp parameter
 
+    try:
+        with get_db_conn() as conn, conn.cursor() as cursor:
+            # One round trip: check, update and fetch the row together.
             cursor.execute(
-                """
-                UPDATE prayer_candidates
-                SET status = 'prayed', status_timestamp = %s
-                WHERE id = %s AND status = 'queued'
-            """,
+                _SQL_MARK_PRAYED,
                 (now_timestamp, candidate_id),
+                prepare=True,
             )
+            updated_row = cursor.fetchone()
 
-            rows_affected = cursor.rowcount
-            if rows_affected > 0:
-                conn.commit()
-                current_app.logger.info(
-                    f"Marked representative ID {candidate_id} as 'prayed' (PostgreSQL)."
-                )
-                processed_item_details = item_to_update
-                processed_item_details["status"] = "prayed"
-                # Ensure timestamp is a string for frontend, though DB stores it as TIMESTAMP
-                processed_item_details["timestamp"] = now_timestamp.strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                )
-                return processed_item_details, rows_affected
-            else:
-                conn.rollback()  # Should not happen if initial check passed
+            if not updated_row:
                 current_app.logger.warning(
-                    f"Mark as prayed for ID {candidate_id} (PostgreSQL) affected 0 rows, "
-                    f"despite initial check."
+                    "Attempted to mark item ID %s as prayed, "
+                    "but it was not found or not in 'queued' state (PostgreSQL).",
+                    candidate_id,
                 )
                 return None, 0
-    except psycopg2.Error as e:
+
+            conn.commit()
+            _clear_stats_cache()
+            current_app.logger.info(
+                "Marked representative ID %s as 'prayed' (PostgreSQL).", candidate_id
+            )
+            return updated_row, 1
+    except psycopg.Error as e:
         current_app.logger.error(
-            f"PostgreSQL error marking representative ID {candidate_id} as prayed: {e}"
+            "PostgreSQL error marking representative ID %s as prayed: %s",
+            candidate_id,
+            e,
         )
-        if conn:
-            conn.rollback()
         return None, 0
     except Exception as e_gen:
         current_app.logger.error(
-            f"Unexpected error in mark_representative_as_prayed (PG): {e_gen}",
+            "Unexpected error in mark_representative_as_prayed (PG): %s",
+            e_gen,
             exc_info=True,
         )
-        if conn:
-            conn.rollback()
         return None, 0
-    finally:
-        if conn:
-            conn.close()
 
 
 def put_representative_back_in_queue(candidate_id, new_hex_id=None):
@@ -245,232 +469,209 @@ def put_representative_back_in_queue(candidate_id, new_hex_id=None):
     Updates a representative's status to 'queued' (PostgreSQL).
     If new_hex_id is provided, it also updates the hex_id.
     """
-    conn = None
-    if not DATABASE_URL:
-        current_app.logger.error(
-            "DATABASE_URL not set, cannot put representative back in queue."
-        )
-        return 0
-
     now_timestamp = datetime.now()  # Use datetime object
 
     try:
-        conn = get_db_conn()
-        with conn.cursor(cursor_factory=DictCursor) as cursor:
+        with get_db_conn() as conn, conn.cursor() as cursor:
             cursor.execute(
-                "SELECT * FROM prayer_candidates WHERE id = %s AND status = 'prayed'",
-                (candidate_id,),
+                _SQL_PUT_BACK_IN_QUEUE,
+                (now_timestamp, new_hex_id, candidate_id),
             )
-            item_to_update_row = cursor.fetchone()
+            updated_row = cursor.fetchone()
 
-            if not item_to_update_row:
+            if not updated_row:
                 current_app.logger.warning(
-                    f"Attempted to put item ID {candidate_id} back in queue (PG), but it "
-                    f"was not found or not in 'prayed' state."
+                    "Attempted to put item ID %s back in queue (PG), "
+                    "but it was not found or not in 'prayed' state.",
+                    candidate_id,
                 )
                 return 0
 
-            item_to_update = dict(item_to_update_row)
-            final_hex_id = (
-                new_hex_id if new_hex_id is not None else item_to_update["hex_id"]
-            )
-
-            cursor.execute(
-                """
-                UPDATE prayer_candidates
-                SET status = 'queued', status_timestamp = %s, hex_id = %s
-                WHERE id = %s AND status = 'prayed'
-            """,
-                (now_timestamp, final_hex_id, candidate_id),
+            conn.commit()
+            _clear_stats_cache()
+            current_app.logger.info(
+                "Put representative ID %s back to 'queued' (PG), hex_id set to %s.",
+                candidate_id,
+                updated_row["hex_id"],
             )
-
-            rows_affected = cursor.rowcount
-            if rows_affected > 0:
-                conn.commit()
-                current_app.logger.info(
-                    f"Put representative ID {candidate_id} back to 'queued' (PG), hex_id set to {final_hex_id}."
-                )
-            else:
-                conn.rollback()  # Should not happen
-                current_app.logger.warning(
-                    f"Put back for ID {candidate_id} (PG) affected 0 rows."
-                )
-            return rows_affected
-    except psycopg2.Error as e:
+            return 1
+    except psycopg.Error as e:
         current_app.logger.error(
-            f"PostgreSQL error putting representative ID {candidate_id} back to queue: {e}"
+            "PostgreSQL error putting representative ID %s back to queue: %s",
+            candidate_id,
+            e,
         )
-        if conn:
-            conn.rollback()
         return 0
     except Exception as e_gen:
         current_app.logger.error(
-            f"Unexpected error in put_representative_back_in_queue (PG): {e_gen}",
+            "Unexpected error in put_representative_back_in_queue (PG): %s",
+            e_gen,
             exc_info=True,
         )
-        if conn:
-            conn.rollback()
         return 0
-    finally:
-        if conn:
-            conn.close()
 
 
 def get_available_hex_id_for_country(country_code, exclude_candidate_id=None):
     """
     Finds an available hex_id for a given country from its map (PostgreSQL version).
     """
-    conn = None
-    if not DATABASE_URL:
-        current_app.logger.error("DATABASE_URL not set, cannot get available hex_id.")
-        return None
-
-    # hex_map_gdf is expected to be on current_app, populated by data_initializer
-    # from the main app.HEX_MAP_DATA_STORE
-    hex_map_gdf = current_app.hex_map_data_store.get(country_code)
-
-    if hex_map_gdf is None or hex_map_gdf.empty or "id" not in hex_map_gdf.columns:
+    # The map's ids, collected once at startup by map_service.cache_hex_geometry
+    # (empty when the map or its 'id' column is missing).
+    map_hex_ids = current_app.hex_id_sets.get(country_code)
+    if not map_hex_ids:
         current_app.logger.warning(
-            f"Hex map data or 'id' column not available for {country_code} via "
-            f"current_app.hex_map_data_store. Cannot assign hex_id."
+            "No map hex ids loaded for %s in current_app.hex_id_sets. "
+            "Cannot assign hex_id.",
+            country_code,
         )
         return None
 
-    all_map_hex_ids = set(hex_map_gdf["id"].unique())
+    # The ids go up as one array parameter and PostgreSQL does the anti-join
+    # against used ids and the random pick in a single round trip.
+    all_map_hex_ids = list(map_hex_ids)
 
-    used_hex_ids = set()
     try:
-        conn = get_db_conn()
-        with conn.cursor(cursor_factory=DictCursor) as cursor:
-            query = """
-                SELECT hex_id FROM prayer_candidates
-                WHERE country_code = %s AND hex_id IS NOT NULL AND (status = 'prayed' OR status = 'queued')
-            """
-            params = [country_code]
-            if exclude_candidate_id:
-                query += " AND id != %s"
-                params.append(exclude_candidate_id)
-
-            cursor.execute(query, tuple(params))
-            used_hex_rows = cursor.fetchall()
-            used_hex_ids = {row["hex_id"] for row in used_hex_rows}
+        with get_db_conn() as conn, conn.cursor() as cursor:
+            cursor.execute(
+                _SQL_PICK_AVAILABLE_HEX_ID,
+                (all_map_hex_ids, country_code, exclude_candidate_id or -1),
+            )
+            row = cursor.fetchone()
 
-    except psycopg2.Error as e:
+    except psycopg.Error as e:
         current_app.logger.error(
-            f"PostgreSQL error fetching used hex_ids for {country_code}: {e}"
+            "PostgreSQL error picking an available hex_id for %s: %s", country_code, e
         )
         return None  # Cannot determine available hex_ids
     except Exception as e_gen:
         current_app.logger.error(
-            f"Unexpected error in get_available_hex_id_for_country (PG db part): {e_gen}",
+            "Unexpected error in get_available_hex_id_for_country (PG db part): %s",
+            e_gen,
             exc_info=True,
         )
         return None
-    finally:
-        if conn:
-            conn.close()
 
-    available_hex_ids = list(all_map_hex_ids - used_hex_ids)
-    if not available_hex_ids:
+    if not row:
         current_app.logger.warning(
-            f"No available hex_ids to assign in {country_code} (PG)."
+            "No available hex_ids to assign in %s (PG).", country_code
         )
         return None
 
-    random.shuffle(available_hex_ids)
-    assigned_hex_id = available_hex_ids.pop()
+    assigned_hex_id = row["hex_id"]
     current_app.logger.info(
-        f"Assigned available hex_id {assigned_hex_id} for {country_code} (PG)."
+        "Assigned available hex_id %s for %s (PG).", assigned_hex_id, country_code
     )
     return assigned_hex_id
 
 
 def purge_all_data():
     """Deletes all records from the prayer_candidates table (PostgreSQL)."""
-    conn = None
-    if not DATABASE_URL:
-        current_app.logger.error("DATABASE_URL not set, cannot purge data.")
-        return False
     try:
-        conn = get_db_conn()
-        with conn.cursor() as cursor:
-            cursor.execute("DELETE FROM prayer_candidates")
-            # No need to delete from prayer_queue or prayed_items as they are legacy SQLite tables
-            conn.commit()
+        with get_db_conn() as conn, conn.cursor() as cursor:
+            # One transaction (and one commit) for every statement in the block;
+            # it is rolled back as a whole if any of them fails.
+            with conn.transaction():
+                cursor.execute(_SQL_PURGE_ALL)
+                # No need to delete from prayer_queue or prayed_items as they are legacy SQLite tables
+            _clear_stats_cache()
             current_app.logger.info(
-                f"Purged all {cursor.rowcount} items from prayer_candidates table (PostgreSQL)."
+                "Purged all %d items from prayer_candidates table (PostgreSQL).",
+                cursor.rowcount,
             )
         return True
-    except psycopg2.Error as e:
-        current_app.logger.error(f"PostgreSQL error during purge: {e}")
-        if conn:
-            conn.rollback()
+    except psycopg.Error as e:
+        current_app.logger.error("PostgreSQL error during purge: %s", e)
         return False
     except Exception as e_gen:
         current_app.logger.error(
-            f"Unexpected error in purge_all_data (PG): {e_gen}", exc_info=True
+            "Unexpected error in purge_all_data (PG): %s", e_gen, exc_info=True
         )
-        if conn:
-            conn.rollback()
         return False
-    finally:
-        if conn:
-            conn.close()
 
 
 # --- Statistics ---
-def get_party_statistics(country_code):
-    """Calculates prayed-for counts by party for a given country (uses PG get_prayed_representatives)."""
-    prayed_items_for_country = get_prayed_representatives(
-        country_code
-    )  # This now uses PostgreSQL
+def _fetch_party_counts(country_code):
+    """
+    Returns {party: prayed count} for a country, aggregated by PostgreSQL.
+    Successful reads are cached for STATS_CACHE_TTL_SECONDS.
+    """
+    cache_key = ("party_counts", country_code)
+    party_counts, generation = _get_cached_stat(cache_key)
+    if party_counts is not None:
+        return party_counts
     party_counts = {}
+    try:
+        with get_db_conn() as conn, conn.cursor() as cursor:
+            cursor.execute(_SQL_PARTY_COUNTS, (country_code,))
+            party_counts = {row["party"]: row["prayed_count"] for row in cursor}
+            _set_cached_stat(cache_key, party_counts, generation)
+    except psycopg.Error as e:
+        current_app.logger.error("PostgreSQL error in _fetch_party_counts: %s", e)
+    except Exception as e_gen:
+        current_app.logger.error(
+            "Unexpected error in _fetch_party_counts (PG): %s", e_gen, exc_info=True
+        )
+    return party_counts
+
 
+def get_party_statistics(country_code):
+    """Calculates prayed-for counts by party for a given country (GROUP BY in PostgreSQL)."""
     # Use APP_COUNTRIES_CONFIG if direct import, else current_app.config['PARTY_INFO']
     # Assuming PARTY_INFO is correctly set on current_app.config by the factory
     country_party_info_map = current_app.config["PARTY_INFO"].get(country_code, {})
-    other_party_default = {"short_name": "Other", "color": "#CCCCCC"}
+    # Static per country, built once in create_app
+    party_to_short = current_app.party_short_name_maps.get(country_code) or {
+        "Other": "Other"
+    }
+    other_short_name = party_to_short["Other"]
 
-    for item in prayed_items_for_country:
-        party_name = item.get("party", "Other")
-        party_details = country_party_info_map.get(
-            party_name, country_party_info_map.get("Other", other_party_default)
-        )
-        short_name = party_details["short_name"]
-        party_counts[short_name] = party_counts.get(short_name, 0) + 1
+    # Several parties can share a short_name (and unknown ones fold into
+    # "Other"), so the per-party counts are still summed here.
+    party_counts = Counter()
+    for party_name, party_count in _fetch_party_counts(country_code).items():
+        party_counts[party_to_short.get(party_name, other_short_name)] += party_count
 
-    sorted_party_counts = sorted(party_counts.items(), key=lambda x: x[1], reverse=True)
+    sorted_party_counts = party_counts.most_common()
     current_app.logger.debug(
-        f"Calculated party statistics for {country_code} (PG): {sorted_party_counts}"
+        "Calculated party statistics for %s (PG): %s", country_code, sorted_party_counts
     )
     return sorted_party_counts, country_party_info_map
 
 
+def _iter_prayed_timedata(country_codes, batch=PRAYED_ITER_BATCH):
+    """
+    Yields the prayed items for the given countries, oldest first, with only
+    the columns the time chart needs. One query regardless of how many
+    countries are asked for, streamed through a server-side cursor.
+    """
+    try:
+        with get_db_conn() as conn, conn.cursor(name="prayed_timedata_cur") as cursor:
+            cursor.itersize = batch
+            cursor.execute(_SQL_PRAYED_TIMEDATA, (list(country_codes),))
+            yield from cursor
+    except psycopg.Error as e:
+        current_app.logger.error("PostgreSQL error in _iter_prayed_timedata: %s", e)
+    except Exception as e_gen:
+        current_app.logger.error(
+            "Unexpected error in _iter_prayed_timedata (PG): %s", e_gen, exc_info=True
+        )
+
+
 def get_timedata_statistics(country_code):
-    """Gets timestamped prayer data for a country or overall (uses PG get_prayed_representatives)."""
-    items_for_timedata = []
+    """Gets timestamped prayer data for a country or overall, oldest first (PostgreSQL)."""
     # Use APP_COUNTRIES_CONFIG if direct import, else current_app.config['COUNTRIES_CONFIG']
     target_countries = current_app.config["COUNTRIES_CONFIG"]
 
     if country_code == "overall":
-        for c_code in target_countries.keys():
-            items_for_timedata.extend(get_prayed_representatives(c_code))  # PG
-        items_for_timedata.sort(key=lambda x: x.get("timestamp", ""))
+        items_for_timedata = _iter_prayed_timedata(target_countries.keys())
     else:
-        items_for_timedata = get_prayed_representatives(country_code)  # PG
+        items_for_timedata = _iter_prayed_timedata([country_code])
 
     timestamps = []
     values = []
     for item in items_for_timedata:
-        # Timestamps from DictCursor (psycopg2) might be datetime objects.
-        # Ensure they are formatted as strings if the consumer expects strings.
-        ts_value = item.get("timestamp")
-        if isinstance(ts_value, datetime):
-            ts_str = ts_value.strftime("%Y-%m-%d %H:%M:%S")
-        elif isinstance(ts_value, str):
-            ts_str = ts_value  # Already a string
-        else:
-            ts_str = None
+        # Already formatted as 'YYYY-MM-DD HH24:MI:SS' by to_char() in the query.
+        ts_str = item.get("timestamp")
 
         if ts_str:
             timestamps.append(ts_str)
@@ -487,38 +688,35 @@ def get_timedata_statistics(country_code):
             values.append(value_detail)
 
     current_app.logger.debug(
-        f"Fetched timedata for {country_code} (PG): {len(timestamps)} entries."
+        "Fetched timedata for %s (PG): %d entries.", country_code, len(timestamps)
     )
     return {"timestamps": timestamps, "values": values}
 
 
 def get_overall_prayed_count():
-    """Gets the total count of prayed-for items across all countries (PostgreSQL)."""
-    count = 0
-    conn = None
-    if not DATABASE_URL:
-        current_app.logger.error(
-            "DATABASE_URL not set, cannot get overall prayed count."
-        )
+    """
+    Gets the total count of prayed-for items across all countries (PostgreSQL).
+    Successful reads are cached for STATS_CACHE_TTL_SECONDS.
+    """
+    count, generation = _get_cached_stat("overall_prayed_count")
+    if count is not None:
         return count
+    count = 0
     try:
-        conn = get_db_conn()
-        with conn.cursor() as cursor:  # No DictCursor needed for simple count
-            cursor.execute(
-                "SELECT COUNT(id) FROM prayer_candidates WHERE status = 'prayed'"
-            )
+        with get_db_conn() as conn, conn.cursor() as cursor:
+            cursor.execute(_SQL_OVERALL_PRAYED_COUNT, prepare=True)
             row = cursor.fetchone()
-            count = row[0] if row else 0
-            current_app.logger.debug(f"Overall prayed count from DB (PG): {count}")
-    except psycopg2.Error as e:
-        current_app.logger.error(f"PostgreSQL error in get_overall_prayed_count: {e}")
+            count = row["prayed_count"] if row else 0
+            current_app.logger.debug("Overall prayed count from DB (PG): %s", count)
+            _set_cached_stat("overall_prayed_count", count, generation)
+    except psycopg.Error as e:
+        current_app.logger.error("PostgreSQL error in get_overall_prayed_count: %s", e)
     except Exception as e_gen:
         current_app.logger.error(
-            f"Unexpected error in get_overall_prayed_count (PG): {e_gen}", exc_info=True
+            "Unexpected error in get_overall_prayed_count (PG): %s",
+            e_gen,
+            exc_info=True,
         )
-    finally:
-        if conn:
-            conn.close()
     return count
 
 
@@ -1,4 +1,5 @@
 from datetime import datetime as dt, timedelta
+from functools import lru_cache
 
 
 def format_pretty_timestamp(timestamp_str):
@@ -8,12 +9,22 @@ def format_pretty_timestamp(timestamp_str):
     """
     if not timestamp_str:
         return "N/A"
-    try:
-        timestamp = dt.strptime(str(timestamp_str), "%Y-%m-%d %H:%M:%S")
-    except ValueError:
-        if isinstance(timestamp_str, dt):  # Check if it's already a datetime object
-            timestamp = timestamp_str
-        else:
+    # "today"/"yesterday" depend on the current date, so it is part of the
+    # cache key and results from an earlier day are never reused.
+    return _format_timestamp_for_day(timestamp_str, dt.now().date().toordinal())
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp_for_day(timestamp_str, today_ordinal):
+    """format_pretty_timestamp relative to the day with ordinal today_ordinal."""
+    if isinstance(timestamp_str, dt):  # Check if it's already a datetime object
+        timestamp = timestamp_str
+    else:
+        try:
+            # fromisoformat parses "YYYY-MM-DD HH:MM:SS" in C, without
+            # walking a format string like strptime does.
+            timestamp = dt.fromisoformat(str(timestamp_str))
+        except ValueError:
             # Consider logging this error if current_app logger is available/passed
             # For now, return a simple error indicator.
             # from flask import current_app
@@ -21,8 +32,7 @@ def format_pretty_timestamp(timestamp_str):
             #    current_app.logger.warning(f"Invalid timestamp format received: {timestamp_str}")
             return "Invalid date"
 
-    now = dt.now()
-    delta_days = (now.date() - timestamp.date()).days
+    delta_days = today_ordinal - timestamp.toordinal()
     time_str = timestamp.strftime("%H:%M")
 
     if delta_days == 0:
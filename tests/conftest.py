@@ -1,111 +1,115 @@
 # tests/conftest.py
-import sys
+# The project root is put on sys.path by ``pythonpath`` in pytest.ini.
 import os
-import pytest  # Moved pytest import higher
+from functools import lru_cache
 
-print("CONFTTEST_TOP: Conftest.py is being loaded.")
+import pytest
 
-# Add the project root directory to sys.path
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-print(f"CONFTTEST_SYSPATH: Modifying sys.path. PROJECT_ROOT='{PROJECT_ROOT}'")
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
-    print(f"CONFTTEST_SYSPATH: Added PROJECT_ROOT. sys.path[0]='{sys.path[0]}'")
-else:
-    print("CONFTTEST_SYSPATH: PROJECT_ROOT already in sys.path.")
-print("CONFTTEST_SYSPATH: Full sys.path now: " + str(sys.path))
+from project import create_app
 
 
-@pytest.fixture
-def app(monkeypatch):  # Add monkeypatch as an argument
-    print("CONFTTEST_FIXTURE_APP: app() fixture called.")
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _mock_db():
+    """
+    Routes every database call in the session to tests.mocks.db_mocks, for
+    tests with or without the app. Patches go through a session-long
+    MonkeyPatch (the built-in ``monkeypatch`` fixture is function-scoped) and
+    are undone at teardown.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _patch_db_access(monkeypatch)
+        yield
+
+
+@pytest.fixture(scope="session")
+def app_factory(_mock_db):
+    """
+    Returns ``make_app(**config_overrides)``. Each distinct set of overrides
+    builds its app once per session; later calls get the cached instance.
+    """
+
+    @lru_cache(maxsize=8)
+    def _cached_app(config_key):
+        return _build_app(dict(config_key))
+
+    def make_app(**config_overrides):
+        return _cached_app(tuple(sorted(config_overrides.items())))
+
+    return make_app
+
+
+@pytest.fixture(scope="session")
+def app(app_factory):
+    """The Flask app with the default testing config, built once per session."""
+    return app_factory()
+
 
+def _patch_db_access(monkeypatch):
     os.environ["FLASK_ENV"] = "testing"
-    print("CONFTTEST_FIXTURE_APP: FLASK_ENV set to 'testing'.")
 
     from project.config import TestingConfig
 
     # This is app.config['DATABASE_URL'] which is 'postgresql://mocked...'
-    # project.db_utils.DATABASE_URL will also pick this up from env var if we set it.
-    test_db_url_for_env = TestingConfig.DATABASE_URL
-
-    original_db_url_env = os.environ.get("DATABASE_URL")
-    os.environ["DATABASE_URL"] = test_db_url_for_env
-    print(
-        f"CONFTTEST_FIXTURE_APP: Set os.environ['DATABASE_URL'] to: {test_db_url_for_env}"
-    )
+    # project.db_utils.DATABASE_URL picks this up from the env var on import.
+    monkeypatch.setenv("DATABASE_URL", TestingConfig.DATABASE_URL)
 
     # Apply monkeypatches BEFORE create_app() is called
     from tests.mocks import db_mocks
 
     monkeypatch.setattr("project.db_utils.get_db_conn", db_mocks.get_mock_db_conn)
-    print("CONFTTEST_FIXTURE_APP: Patched 'project.db_utils.get_db_conn' with mock.")
 
     monkeypatch.setattr(
         "app.init_db", db_mocks.mock_init_db
     )  # Patches init_db in app.py module
-    print(
-        "CONFTTEST_FIXTURE_APP: Patched 'app.init_db' (from root app.py module) with mock."
-    )
 
     # Also mock other app.py functions that data_initializer calls and that interact with DB
     # to prevent them from running with a mock connection that might not return expected data for their logic.
     # For app creation, it's often enough that they don't raise errors.
     def mock_load_prayed_from_db():
-        print("Mocked app.load_prayed_for_data_from_db called.")
         # current_app.prayed_for_data should already be initialized as {} by create_app
         pass  # Does not attempt to load from DB
 
     monkeypatch.setattr("app.load_prayed_for_data_from_db", mock_load_prayed_from_db)
-    print(
-        "CONFTTEST_FIXTURE_APP: Patched 'app.load_prayed_for_data_from_db' with mock."
-    )
 
     def mock_update_queue():
-        print("Mocked app.update_queue called.")
         # This function is complex; for app creation test, just ensure it doesn't error.
         # It uses current_app.hex_map_data_store, which should be {}
         pass
 
     monkeypatch.setattr("app.update_queue", mock_update_queue)
-    print("CONFTTEST_FIXTURE_APP: Patched 'app.update_queue' with mock.")
 
-    print(
-        "CONFTTEST_FIXTURE_APP: Attempting 'from project import create_app' (after patching)."
-    )
-    from project import create_app
-
-    app_instance = create_app()
 
-    # Restore original DATABASE_URL in environment
-    if original_db_url_env is None:
-        if "DATABASE_URL" in os.environ:
-            del os.environ["DATABASE_URL"]
-    else:
-        os.environ["DATABASE_URL"] = original_db_url_env
-    print("CONFTTEST_FIXTURE_APP: Restored os.environ['DATABASE_URL'] (if any).")
+def _build_app(config_overrides):
+    app_instance = create_app(config_overrides or None)
 
-    print(
-        f"CONFTTEST_FIXTURE_APP: app.config['DATABASE_URL'] is: {app_instance.config['DATABASE_URL']}"
-    )
     expected_mock_db_url_part = "mocked_db"
     actual_app_config_db_url = app_instance.config["DATABASE_URL"]
-    print(
-        f"CONFTTEST_FIXTURE_APP: Actual DATABASE_URL from app.config: {actual_app_config_db_url}"
-    )
     assert expected_mock_db_url_part in actual_app_config_db_url, (
         f"App.config['DATABASE_URL'] not using mocked URL. "
         f"Expected '{expected_mock_db_url_part}' in path '{actual_app_config_db_url}'"
     )
 
-    yield app_instance
-
-    print("CONFTTEST_FIXTURE_APP: Mocked app fixture teardown.")
+    return app_instance
 
 
 @pytest.fixture
 def client(app):
-    """A test client for the app."""
+    """A test client for the app (one per test, so cookies never leak)."""
     return app.test_client()
 
 
@@ -113,3 +117,15 @@ def client(app):
 def runner(app):
     """A test runner for the app's Click commands."""
     return app.test_cli_runner()
+
+
+# Map generation renders a full matplotlib figure, so each country's map is
+# requested once per session and shared by every test that inspects it.
+@pytest.fixture(scope="session")
+def israel_map_response(app):
+    return app.test_client().get("/generate_map_for_country_json/israel")
+
+
+@pytest.fixture(scope="session")
+def iran_map_response(app):
+    return app.test_client().get("/generate_map_for_country_json/iran")
@@ -1,9 +1,33 @@
 import logging
+from contextlib import contextmanager
+from functools import lru_cache
+
+# Statements that report expected_rowcount instead of a result-set size
+_DML_VERBS = frozenset(("INSERT", "UPDATE", "DELETE"))
+
+
+@lru_cache(maxsize=256)
+def _is_dml(query):
+    # The app runs the same module-level SQL strings over and over, so each
+    # distinct query is classified once.
+    return query.lstrip()[:6].upper() in _DML_VERBS
+
+
+def _debug_enabled():
+    # Checked before building per-call debug messages, which would otherwise
+    # be formatted (params and all) on every mocked query.
+    return logging.getLogger().isEnabledFor(logging.DEBUG)
 
 
 class MockCursor:
     def __init__(self, connection):
         self.connection = connection
+        self._reset()
+
+    def _reset(self):
+        # Called on creation and whenever a pooled cursor is handed out again,
+        # so no query state leaks from one ``conn.cursor()`` to the next.
+        self.closed = False
         self.description = None
         self.rowcount = -1
         self._results = []
@@ -11,37 +35,64 @@ class MockCursor:
         self._params = None
         # Allow tests to set expected return values for fetchone/fetchall
         self.fetchone_return_value = None
-        self.fetchall_return_value = []
+        self.fetchall_return_value = ()
         self.expected_rowcount = 0  # For update/delete operations
 
-    def execute(self, query, params=None):
+    @property
+    def fetchall_return_value(self):
+        return self._rows
+
+    @fetchall_return_value.setter
+    def fetchall_return_value(self, rows):
+        # The length is taken once here rather than on every execute()
+        self._rows = rows
+        self._rows_len = len(rows)
+
+    def execute(self, query, params=None, prepare=None):
         self._query = query
         self._params = params
-        logging.debug(f"MockCursor executed: {query} with params: {params}")
+        self.connection.executed.append((query, params))
+        if _debug_enabled():
+            logging.debug("MockCursor executed: %s with params: %s", query, params)
         # Simulate rowcount for DML, or set up for DQL
-        if query.strip().upper().startswith(("INSERT", "UPDATE", "DELETE")):
+        if _is_dml(query):
             self.rowcount = self.expected_rowcount
         else:  # SELECT
-            self.rowcount = (
-                len(self.fetchall_return_value)
-                if self.fetchall_return_value
-                else (1 if self.fetchone_return_value else 0)
+            self.rowcount = self._rows_len or int(bool(self.fetchone_return_value))
+
+    def executemany(self, query, params_seq):
+        params_seq = list(params_seq)
+        if _debug_enabled():
+            logging.debug(
+                "MockCursor executemany: %s with %d rows", query, len(params_seq)
             )
+        self._query = query
+        self._params = params_seq
+        self.rowcount = self.expected_rowcount
 
     def fetchone(self):
-        logging.debug(
-            f"MockCursor fetchone called. Returning: {self.fetchone_return_value}"
-        )
+        if _debug_enabled():
+            logging.debug(
+                "MockCursor fetchone called. Returning: %s", self.fetchone_return_value
+            )
         return self.fetchone_return_value
 
     def fetchall(self):
-        logging.debug(
-            f"MockCursor fetchall called. Returning: {self.fetchall_return_value}"
-        )
+        if _debug_enabled():
+            logging.debug(
+                "MockCursor fetchall called. Returning: %s", self.fetchall_return_value
+            )
         return self.fetchall_return_value
 
+    def __iter__(self):
+        # Named (server-side) cursors are iterated instead of fetched.
+        return iter(self.fetchall_return_value)
+
     def close(self):
         logging.debug("MockCursor closed.")
+        if not self.closed:
+            self.closed = True
+            self.connection._release_cursor(self)
 
     def __enter__(self):
         return self
@@ -54,17 +105,43 @@ class MockConnection:
     def __init__(self, dsn=None):
         self.dsn = dsn
         self.closed = False
-        self._cursor = MockCursor(
-            self
-        )  # Each connection gets one main cursor for simplicity in mock
-        self.autocommit = False  # Mimic psycopg2 connection attribute
-
-    def cursor(self, cursor_factory=None):
-        logging.debug(
-            f"MockConnection cursor called (factory: {cursor_factory}). Returning shared mock cursor."
-        )
-        # Return the shared cursor or a new one if advanced mocking needed per cursor
-        return self._cursor
+        # Closed cursors are kept here and reset when handed out again
+        self._cursor_pool = []
+        self._next_cursor_config = {}
+        # (query, params) of every execute() on this connection's cursors
+        self.executed = []
+        self.autocommit = False  # Mimic psycopg connection attribute
+
+    def cursor(self, name=None, row_factory=None):
+        if _debug_enabled():
+            logging.debug(
+                "MockConnection cursor called (name: %s, row factory: %s).",
+                name,
+                row_factory,
+            )
+        if self._cursor_pool:
+            cursor = self._cursor_pool.pop()
+            cursor._reset()
+        else:
+            cursor = MockCursor(self)
+        if self._next_cursor_config:
+            for attr, value in self._next_cursor_config.items():
+                setattr(cursor, attr, value)
+            self._next_cursor_config = {}
+        return cursor
+
+    def execute(self, query, params=None, prepare=None):
+        # Like psycopg 3's Connection.execute: runs on a new cursor, returned
+        cursor = self.cursor()
+        cursor.execute(query, params, prepare=prepare)
+        return cursor
+
+    def next_cursor_config(self, **attrs):
+        """Seeds the next cursor() result, e.g. fetchone_return_value={...}."""
+        self._next_cursor_config.update(attrs)
+
+    def _release_cursor(self, cursor):
+        self._cursor_pool.append(cursor)
 
     def commit(self):
         logging.debug("MockConnection commit called.")
@@ -72,6 +149,17 @@ class MockConnection:
     def rollback(self):
         logging.debug("MockConnection rollback called.")
 
+    @contextmanager
+    def transaction(self):
+        logging.debug("MockConnection transaction started.")
+        try:
+            yield self
+        except Exception:
+            self.rollback()
+            raise
+        else:
+            self.commit()
+
     def close(self):
         self.closed = True
         logging.debug("MockConnection closed.")
@@ -83,14 +171,24 @@ class MockConnection:
         self.close()
 
 
+@contextmanager
 def get_mock_db_conn(*args, **kwargs):
-    """Factory function to be used by monkeypatch for project.db_utils.get_db_conn."""
+    """Context manager to be used by monkeypatch for project.db_utils.get_db_conn."""
     logging.debug(
-        f"get_mock_db_conn called with args: {args}, kwargs: {kwargs}. Returning MockConnection."
+        "get_mock_db_conn called with args: %s, kwargs: %s. Returning MockConnection.",
+        args,
+        kwargs,
     )
     # The DSN from DATABASE_URL will be passed as the first arg if present in the original call
     dsn = args[0] if args else kwargs.get("dsn")
-    return MockConnection(dsn=dsn)
+    conn = MockConnection(dsn=dsn)
+    try:
+        yield conn
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
 
 
 def mock_init_db(*args, **kwargs):
@@ -99,8 +197,9 @@ def mock_init_db(*args, **kwargs):
     pass
 
 
-# Example of how a test might configure the cursor:
-# mock_cursor_instance = my_mock_connection.cursor()
-# mock_cursor_instance.fetchall_return_value = [{'id': 1, 'name': 'Test1'}, {'id': 2, 'name': 'Test2'}]
-# mock_cursor_instance.fetchone_return_value = {'id': 1, 'name': 'Test1'}
-# mock_cursor_instance.expected_rowcount = 1 # For an update
+# Example of how a test might configure the cursor the code under test opens next:
+# my_mock_connection.next_cursor_config(
+#     fetchall_return_value=[{'id': 1, 'name': 'Test1'}, {'id': 2, 'name': 'Test2'}],
+#     fetchone_return_value={'id': 1, 'name': 'Test1'},
+#     expected_rowcount=1,  # For an update
+# )
@@ -0,0 +1,27 @@
+import pytest
+
+from tests.mocks.db_mocks import MockConnection
+
+
+@pytest.fixture
+def db_utils(app):
+    # Imported after the app fixture has set DATABASE_URL
+    from project import db_utils
+
+    return db_utils
+
+
+def test_configure_conn_sends_the_configured_synchronous_commit(db_utils, monkeypatch):
+    monkeypatch.setattr(db_utils, "DB_SYNCHRONOUS_COMMIT", "local")
+    conn = MockConnection()
+    db_utils._configure_conn(conn)
+    assert conn.executed == [
+        ("SELECT set_config('synchronous_commit', %s, false)", ("local",))
+    ]
+
+
+def test_configure_conn_keeps_the_server_default_when_unset(db_utils, monkeypatch):
+    monkeypatch.setattr(db_utils, "DB_SYNCHRONOUS_COMMIT", None)
+    conn = MockConnection()
+    db_utils._configure_conn(conn)
+    assert conn.executed == []
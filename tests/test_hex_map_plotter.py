@@ -0,0 +1,75 @@
+import logging
+
+import geopandas as gpd
+import matplotlib.image as mpimg
+import numpy as np
+from shapely.geometry import box
+
+from project.map_utils import hex_map_plotter
+
+
+def _square_map():
+    """Three unit squares side by side, with ids "a", "b" and "c"."""
+    return gpd.GeoDataFrame(
+        {"id": ["a", "b", "c"]},
+        geometry=[box(0, 0, 1, 1), box(2, 0, 3, 1), box(4, 0, 5, 1)],
+    )
+
+
+def test_rendered_map_size_and_hearts(tmp_path):
+    prayed = [
+        {"person_name": "On a", "hex_id": "a", "country_code": "israel"},
+        {"person_name": "On c", "hex_id": "c", "country_code": "israel"},
+    ]
+    for filename, items in (("empty.png", []), ("hearts.png", prayed)):
+        hex_map_plotter.plot_hex_map_with_hearts(
+            _square_map(),
+            None,
+            items,
+            [],
+            "israel",
+            output_dir=str(tmp_path),
+            output_filename=filename,
+        )
+    empty = mpimg.imread(str(tmp_path / "empty.png"))
+    hearts = mpimg.imread(str(tmp_path / "hearts.png"))
+
+    # 10x10in at 100 dpi, cropped to the padded squares; hearts must not
+    # grow the tight bbox
+    assert empty.shape[:2] == hearts.shape[:2] == (255, 875)
+
+    # Hearts sit on squares "a" and "c"; the middle square "b" is untouched
+    changed = np.flatnonzero((empty != hearts).any(axis=(0, 2))) / hearts.shape[1]
+    assert (changed < 0.4).any() and (changed > 0.6).any()
+    assert not ((changed > 0.4) & (changed < 0.6)).any()
+
+
+def test_hearts_placed_only_on_resolved_hex_ids(tmp_path, monkeypatch, caplog):
+    placed = []
+
+    class RecordingHeartLayer(hex_map_plotter._HeartLayer):
+        def __init__(self, heart_groups):
+            super().__init__(heart_groups)
+            for _, xs, ys in heart_groups:
+                placed.extend(zip(xs.tolist(), ys.tolist()))
+
+    monkeypatch.setattr(hex_map_plotter, "_HeartLayer", RecordingHeartLayer)
+    prayed = [
+        {"person_name": "On a", "hex_id": "a", "country_code": "israel"},
+        {"person_name": "On c", "hex_id": "c", "country_code": "israel"},
+        {"person_name": "Unknown hex", "hex_id": "zzz", "country_code": "israel"},
+        {"person_name": "No hex", "hex_id": None, "country_code": "israel"},
+        {"person_name": "Elsewhere", "hex_id": "b", "country_code": "iran"},
+    ]
+
+    with caplog.at_level(logging.WARNING, logger=hex_map_plotter.logger.name):
+        hex_map_plotter.plot_hex_map_with_hearts(
+            _square_map(), None, prayed, [], "israel", output_dir=str(tmp_path)
+        )
+
+    assert sorted(placed) == [(0.5, 0.5), (4.5, 0.5)]
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("hex ID zzz for Unknown hex" in m for m in messages)
+    assert any("No hex for israel (random alloc)" in m for m in messages)
+    assert not any("Elsewhere" in m for m in messages)
+    assert (tmp_path / hex_map_plotter.DEFAULT_MAP_OUTPUT_FILENAME).exists()
@@ -0,0 +1,212 @@
+from contextlib import contextmanager
+from datetime import datetime
+import logging
+
+import pytest
+
+from project.utils import format_pretty_timestamp
+from tests.mocks.db_mocks import MockConnection
+
+
+@pytest.fixture
+def prayer_service(app):
+    # Imported after the app fixture has set DATABASE_URL and patched the DB
+    from project.services import prayer_service
+
+    return prayer_service
+
+
+@pytest.fixture
+def mock_conn(app, prayer_service, monkeypatch):
+    """One MockConnection handed out by every get_db_conn() in the test, with a clean stats cache."""
+    conn = MockConnection()
+
+    @contextmanager
+    def get_conn():
+        yield conn
+
+    monkeypatch.setattr(prayer_service, "get_db_conn", get_conn)
+    prayer_service._clear_stats_cache()
+    with app.app_context():
+        yield conn
+    prayer_service._clear_stats_cache()
+
+
+def test_overall_count_cache_cleared_when_marked_prayed(mock_conn, prayer_service):
+    mock_conn.next_cursor_config(fetchone_return_value={"prayed_count": 5})
+    assert prayer_service.get_overall_prayed_count() == 5
+
+    # Cached: the next query would report 0, but it is not run.
+    assert prayer_service.get_overall_prayed_count() == 5
+
+    mock_conn.next_cursor_config(fetchone_return_value={"id": 7, "status": "prayed"})
+    updated_row, updated_count = prayer_service.mark_representative_as_prayed(7)
+    assert updated_count == 1
+
+    mock_conn.next_cursor_config(fetchone_return_value={"prayed_count": 6})
+    assert prayer_service.get_overall_prayed_count() == 6
+
+
+def test_party_counts_cache_kept_when_nothing_was_marked(mock_conn, prayer_service):
+    mock_conn.next_cursor_config(
+        fetchall_return_value=[{"party": "Likud", "prayed_count": 2}]
+    )
+    assert prayer_service._fetch_party_counts("israel") == {"Likud": 2}
+
+    # Marking a row that is not queued changes nothing, so the cache survives.
+    assert prayer_service.mark_representative_as_prayed(8) == (None, 0)
+    assert prayer_service._fetch_party_counts("israel") == {"Likud": 2}
+
+
+def test_stats_cache_expires_after_ttl(mock_conn, prayer_service, monkeypatch):
+    monkeypatch.setattr(prayer_service, "STATS_CACHE_TTL_SECONDS", 0)
+    mock_conn.next_cursor_config(fetchone_return_value={"prayed_count": 5})
+    assert prayer_service.get_overall_prayed_count() == 5
+
+    mock_conn.next_cursor_config(fetchone_return_value={"prayed_count": 9})
+    assert prayer_service.get_overall_prayed_count() == 9
+
+
+def test_party_counts_read_on_one_borrowed_connection(mock_conn, prayer_service):
+    mock_conn.next_cursor_config(
+        fetchall_return_value=[
+            {"party": "Likud", "prayed_count": 2},
+            {"party": "Shas", "prayed_count": 1},
+        ]
+    )
+    assert prayer_service._fetch_party_counts("israel") == {"Likud": 2, "Shas": 1}
+    # One statement on the connection borrowed from get_db_conn()
+    assert mock_conn.executed == [(prayer_service._SQL_PARTY_COUNTS, ("israel",))]
+
+
+def test_mark_prayed_is_one_conditional_update(mock_conn, prayer_service):
+    row = {"id": 7, "country_code": "israel", "status": "prayed"}
+    mock_conn.next_cursor_config(fetchone_return_value=row)
+    assert prayer_service.mark_representative_as_prayed(7) == (row, 1)
+    # No row back: not found, or no longer queued
+    assert prayer_service.mark_representative_as_prayed(8) == (None, 0)
+
+    statements = [statement for statement, _ in mock_conn.executed]
+    assert statements == [prayer_service._SQL_MARK_PRAYED] * 2
+    for (_, params), candidate_id in zip(mock_conn.executed, (7, 8)):
+        assert isinstance(params[0], datetime)
+        assert params[1:] == (candidate_id,)
+
+
+def test_put_back_passes_none_to_keep_the_hex_id(mock_conn, prayer_service, caplog):
+    mock_conn.next_cursor_config(fetchone_return_value={"hex_id": "h1"})
+    with caplog.at_level(logging.INFO):
+        assert prayer_service.put_representative_back_in_queue(7) == 1
+    # The logged hex_id is the one COALESCE(%s, hex_id) kept, not the None sent
+    assert "ID 7 back to 'queued' (PG), hex_id set to h1" in caplog.text
+
+    mock_conn.next_cursor_config(fetchone_return_value={"hex_id": "h9"})
+    assert prayer_service.put_representative_back_in_queue(7, new_hex_id="h9") == 1
+    # No row back: not found, or not prayed
+    assert prayer_service.put_representative_back_in_queue(8) == 0
+
+    assert [statement for statement, _ in mock_conn.executed] == [
+        prayer_service._SQL_PUT_BACK_IN_QUEUE
+    ] * 3
+    assert [params[1:] for _, params in mock_conn.executed] == [
+        (None, 7),
+        ("h9", 7),
+        (None, 8),
+    ]
+
+
+def test_hex_pick_statement_and_parameters(app, mock_conn, prayer_service, monkeypatch):
+    monkeypatch.setitem(app.hex_id_sets, "israel", frozenset({"h1", "h2"}))
+    mock_conn.next_cursor_config(fetchone_return_value={"hex_id": "h2"})
+    assert prayer_service.get_available_hex_id_for_country("israel") == "h2"
+    # Every hex is taken
+    assert (
+        prayer_service.get_available_hex_id_for_country(
+            "israel", exclude_candidate_id=5
+        )
+        is None
+    )
+
+    (first_sql, first_params), (second_sql, second_params) = mock_conn.executed
+    assert first_sql == second_sql == prayer_service._SQL_PICK_AVAILABLE_HEX_ID
+    assert sorted(first_params[0]) == sorted(second_params[0]) == ["h1", "h2"]
+    # -1 matches no candidate, so without an exclusion every used hex counts
+    assert first_params[1:] == ("israel", -1)
+    assert second_params[1:] == ("israel", 5)
+
+
+def test_hex_pick_without_loaded_hex_ids(app, mock_conn, prayer_service, monkeypatch):
+    monkeypatch.delitem(app.hex_id_sets, "israel", raising=False)
+    assert prayer_service.get_available_hex_id_for_country("israel") is None
+    monkeypatch.setitem(app.hex_id_sets, "israel", frozenset())
+    assert prayer_service.get_available_hex_id_for_country("israel") is None
+    assert mock_conn.executed == []
+
+
+def test_only_list_reads_are_capped(mock_conn, prayer_service, caplog):
+    prayed_rows = [{"id": 1}, {"id": 2}]
+
+    mock_conn.next_cursor_config(fetchall_return_value=prayed_rows)
+    prayer_service.get_map_items("israel")
+    mock_conn.next_cursor_config(fetchall_return_value=prayed_rows)
+    prayer_service.get_prayed_representatives("israel", limit=2)
+
+    (map_sql, map_params), _, (list_sql, list_params) = mock_conn.executed
+    assert "LIMIT" not in map_sql and map_params == ("prayed", "israel")
+    assert list_sql.rstrip().endswith("LIMIT %s")
+    assert list_params == ("prayed", "israel", 2)
+    assert "truncated to the 2 most recent rows" in caplog.text
+
+
+def test_read_that_raced_a_write_is_not_cached(mock_conn, prayer_service, monkeypatch):
+    borrow = prayer_service.get_db_conn
+
+    @contextmanager
+    def get_conn():
+        # A mark-prayed on another thread clears the cache after this read
+        # missed it, while its query is in flight.
+        prayer_service._clear_stats_cache()
+        with borrow() as conn:
+            yield conn
+
+    monkeypatch.setattr(prayer_service, "get_db_conn", get_conn)
+    mock_conn.next_cursor_config(fetchone_return_value={"prayed_count": 5})
+    assert prayer_service.get_overall_prayed_count() == 5
+
+    monkeypatch.setattr(prayer_service, "get_db_conn", borrow)
+    mock_conn.next_cursor_config(fetchone_return_value={"prayed_count": 6})
+    assert prayer_service.get_overall_prayed_count() == 6
+
+
+def test_stats_cache_size_is_bounded(mock_conn, prayer_service, monkeypatch):
+    monkeypatch.setattr(prayer_service, "STATS_CACHE_MAX_ENTRIES", 2)
+    for country_code in ("israel", "iran", "atlantis"):
+        prayer_service._fetch_party_counts(country_code)
+    assert len(prayer_service._stats_cache) <= 2
+    assert ("party_counts", "atlantis") in prayer_service._stats_cache
+
+
+def test_dict_rows_reach_callers_by_column_alias(mock_conn, prayer_service):
+    # Pooled connections use dict_row, so callers read the SQL aliases by name
+    marked = {"id": 7, "country_code": "israel", "timestamp": "2024-02-29 08:00:00"}
+    mock_conn.next_cursor_config(fetchone_return_value=marked)
+    updated_row, _ = prayer_service.mark_representative_as_prayed(7)
+    assert updated_row is marked
+    assert format_pretty_timestamp(updated_row["timestamp"]).endswith("at 08:00")
+
+    timedata_row = {
+        "post_label": "Haifa",
+        "person_name": "Alice Example",
+        "party": "Likud",
+        "country_code": "israel",
+        "timestamp": "2024-02-29 08:00:00",
+    }
+    mock_conn.next_cursor_config(fetchall_return_value=[timedata_row])
+    assert prayer_service.get_timedata_statistics("israel") == {
+        "timestamps": ["2024-02-29 08:00:00"],
+        "values": [{"place": "Haifa", "person": "Alice Example", "party": "Likud"}],
+    }
+    assert mock_conn.executed[-1] == (
+        prayer_service._SQL_PRAYED_TIMEDATA,
+        (["israel"],),
+    )
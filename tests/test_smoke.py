@@ -1,36 +1,50 @@
-def test_home_page(client):
-    """Test that the home page loads."""
-    response = client.get("/")
+import pytest
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/",
+        "/prayer/queue_page",
+        "/prayer/prayed_list_page/overall",
+        "/stats/overall",
+    ],
+)
+def test_page_loads(client, url):
+    """Test that the page loads."""
+    response = client.get(url)
     assert response.status_code == 200
 
 
-def test_queue_page(client):
-    """Test that the queue page loads."""
-    response = client.get("/prayer/queue_page")
-    assert response.status_code == 200
-
-
-def test_prayed_overall_page(client):
-    """Test that the overall prayed page loads."""
-    response = client.get("/prayer/prayed_list_page/overall")
-    assert response.status_code == 200
-
-
-def test_statistics_overall_page(client):
-    """Test that the overall statistics page loads."""
-    response = client.get("/stats/overall")
-    assert response.status_code == 200
-
-
-def test_israel_map_generation(client):
-    """Test generation of Israel map."""
-    response = client.get("/generate_map_for_country_json/israel")
+@pytest.mark.slow
+@pytest.mark.parametrize("map_response", ["israel_map_response", "iran_map_response"])
+def test_map_generation(request, map_response):
+    """Test generation of each country's map (responses are cached per session)."""
+    response = request.getfixturevalue(map_response)
     assert response.status_code == 200
     assert response.content_type == "application/json"  # This route returns JSON
 
 
-def test_iran_map_generation(client):
-    """Test generation of Iran map."""
-    response = client.get("/generate_map_for_country_json/iran")
-    assert response.status_code == 200
-    assert response.content_type == "application/json"  # This route returns JSON
+def test_overall_prayed_list_is_streamed(client, monkeypatch):
+    """The overall prayed list renders rows as they are yielded, not from a list."""
+    from project.services import prayer_service
+
+    rows = [
+        {
+            "id": 1,
+            "person_name": "Alice Example",
+            "post_label": "",
+            "party": "Likud",
+            "country_code": "israel",
+            "timestamp": "2023-10-27 10:05:00",
+        }
+    ]
+    monkeypatch.setattr(
+        prayer_service,
+        "iter_prayed_representatives",
+        lambda country_code=None: iter(rows),
+    )
+    response = client.get("/prayer/prayed_list_page/overall")
+    assert response.is_streamed
+    body = response.get_data(as_text=True)
+    assert "Alice Example" in body and "(Israel)" in body
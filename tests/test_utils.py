@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta
+
+from project.utils import _format_timestamp_for_day, format_pretty_timestamp
+
+
+def _ts(value):
+    """The 'YYYY-MM-DD HH:MM:SS' form written by to_char() and the old strptime format."""
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def test_today_yesterday_and_older():
+    now = datetime.now().replace(hour=12, minute=30)
+    assert format_pretty_timestamp(_ts(now)) == "today at 12:30"
+    assert format_pretty_timestamp(_ts(now - timedelta(days=1))) == "yesterday at 12:30"
+    older = now - timedelta(days=3)
+    assert format_pretty_timestamp(_ts(older)) == (
+        f"on {older.strftime('%d %b %Y')} at 12:30"
+    )
+
+
+def test_old_strptime_format_still_parses():
+    day = datetime(2023, 10, 27).toordinal()
+    assert _format_timestamp_for_day("2023-10-27 10:05:00", day) == "today at 10:05"
+    assert (
+        _format_timestamp_for_day("2023-10-27 10:05:00", day + 2)
+        == "on 27 Oct 2023 at 10:05"
+    )
+    # datetime objects were accepted by the old fallback and still are
+    assert _format_timestamp_for_day(datetime(2023, 10, 27, 10, 5), day + 1) == (
+        "yesterday at 10:05"
+    )
+
+
+def test_cached_result_is_per_day():
+    # The same string must not reuse yesterday's "today" wording.
+    day = datetime(2024, 2, 29).toordinal()
+    assert _format_timestamp_for_day("2024-02-29 08:00:00", day) == "today at 08:00"
+    assert (
+        _format_timestamp_for_day("2024-02-29 08:00:00", day + 1)
+        == "yesterday at 08:00"
+    )
+
+
+def test_empty_and_invalid_input():
+    assert format_pretty_timestamp(None) == "N/A"
+    assert format_pretty_timestamp("") == "N/A"
+    assert format_pretty_timestamp("invalid-date-string") == "Invalid date"